@@ -14,6 +14,8 @@ from .. import data, schema, storage
 class _ItemNode(data.ItemNode):
     """Common base class for data nodes for the HDF5 backend."""
 
+    __slots__ = ('_dataset_name', '_parent')
+
     def clear(self):
         """Clear the data that is held by this data node.
 
@@ -75,6 +77,8 @@ class _ItemNode(data.ItemNode):
 class Array(data.Array, _ItemNode):
     """Array-type data node for the HDF5 backend."""
 
+    __slots__ = ()
+
     def replace(self, new_value):
         """Completely replace the current node value.
 
@@ -104,6 +108,17 @@ class Array(data.Array, _ItemNode):
             maxshape=maxshape,
         )
 
+    def resize(self, size):
+        """Resize the array to the desired size.
+
+        The HDF5 dataset is resized in place, i.e. per dimension. The number of
+        dimensions cannot be changed.
+
+        Args:
+            size (tuple): Desired array size.
+        """
+        self._storage.resize(size)
+
     def _value(self):
         """Return the actual node data, independent of the backend in use.
 
@@ -116,6 +131,8 @@ class Array(data.Array, _ItemNode):
 class Bytes(_ItemNode):
     """Bytes-type data node for the HDF5 backend."""
 
+    __slots__ = ()
+
     def replace(self, new_value):
         """Completely replace the current node value.
 
@@ -144,6 +161,8 @@ class Bytes(_ItemNode):
 class Bool(_ItemNode):
     """Bool-type data node for the HDF5 backend."""
 
+    __slots__ = ()
+
     def replace(self, new_value):
         """Completely replace the current node value.
 
@@ -181,15 +200,16 @@ class Compilation(data.Compilation):
         Args:
             data_storage (dict): Backend-specific data storage object to load.
         """
+        module_name = self.__module__
         for node_name, subnode in self.schema_node.subnodes.items():
             if node_name in data_storage:
                 self._subnodes[node_name] = data.data_node_from_schema(
-                    subnode, self.__module__, self,
+                    subnode, module_name, self,
                     data_storage=data_storage[node_name])
             else:
                 new_params_sub = {'name': node_name, 'parent': data_storage}
                 self._subnodes[node_name] = data.data_node_from_schema(
-                    subnode, self.__module__, self, new_params=new_params_sub)
+                    subnode, module_name, self, new_params=new_params_sub)
 
     def _init_new(self, new_params):
         """Initialize new, empty Compilation.
@@ -211,15 +231,19 @@ class Compilation(data.Compilation):
         else:
             comp_group = new_params['parent']
 
-        for node_name, subnode in self.schema_node.subnodes.items():
-            new_params_sub = {'name': node_name, 'parent': comp_group}
-            self._subnodes[node_name] = data.data_node_from_schema(
-                subnode, self.__module__, self, new_params=new_params_sub)
+        module_name = self.__module__
+        self._subnodes = {
+            node_name: data.data_node_from_schema(
+                subnode, module_name, self,
+                new_params={'name': node_name, 'parent': comp_group})
+            for node_name, subnode in self.schema_node.subnodes.items()}
 
 
 class Date(data.Date, _ItemNode):
     """Date-type data node for the HDF5 backend."""
 
+    __slots__ = ()
+
     def replace(self, new_value):
         """Completely replace the current node value.
 
@@ -246,6 +270,8 @@ class Date(data.Date, _ItemNode):
 class DateTime(data.DateTime, _ItemNode):
     """DateTime-type data node for the HDF5 backend."""
 
+    __slots__ = ()
+
     def replace(self, new_value):
         """Completely replace the current node value.
 
@@ -274,26 +300,7 @@ class DateTime(data.DateTime, _ItemNode):
 class List(data.List):
     """List-type data node for the HDF5 backend."""
 
-    def append(self, value=None):
-        """Append a new data node to the list.
-
-        If a ``value`` is given, it is automatically applied to the new data
-        node. Otherwise, an empty data node is created, which can be useful
-        especially for Lists of Compilations.
-
-        Note: This works with actual data values!
-
-        Args:
-            value: Value to be added to the list.
-        """
-        new_params = {'name': 'item_{}'.format(len(self)),
-                      'parent': self._storage}
-        subnode = data.data_node_from_schema(self.schema_node.subnode,
-                                             self.__module__, self,
-                                             new_params=new_params)
-        self._subnodes.append(subnode)
-        if value is not None:
-            subnode.replace(value)
+    __slots__ = ('_storage',)
 
     def clear(self):
         """Clear all subnodes."""
@@ -324,10 +331,26 @@ class List(data.List):
         """
         self._storage = new_params['parent'].create_group(new_params['name'])
 
+    def _new_subnode(self):
+        """Create a new, empty sub-node for the next list index.
+
+        This creates the sub-node's HDF5 object inside the List's group, named
+        after the index the sub-node will take in the List.
+
+        Returns:
+            New data node for the List's sub-node schema.
+        """
+        new_params = {'name': data._item_name(len(self)),
+                      'parent': self._storage}
+        return self._subnode_class(self.schema_node.subnode, self,
+                                   new_params=new_params)
+
 
 class Scalar(data.Scalar, _ItemNode):
     """Scalar-type data node for the HDF5 backend."""
 
+    __slots__ = ()
+
     def replace(self, new_value):
         """Completely replace the current node value.
 
@@ -411,6 +434,8 @@ class Storage(storage.FileStorage):
 class String(_ItemNode):
     """String-type data node for the HDF5 backend."""
 
+    __slots__ = ()
+
     def replace(self, new_value):
         """Completely replace the current node value.
 
@@ -442,6 +467,8 @@ class String(_ItemNode):
 class Time(data.Time, _ItemNode):
     """Time-type data node for the HDF5 backend."""
 
+    __slots__ = ()
+
     def replace(self, new_value):
         """Completely replace the current node value.
 
@@ -14,6 +14,8 @@ from .. import data, storage
 class _ItemNode(data.ItemNode):
     """Common base class for data nodes for the inmem backend."""
 
+    __slots__ = ()
+
     def replace(self, new_value):
         """Completely replace the current node value.
 
@@ -41,17 +43,17 @@ class _ItemNode(data.ItemNode):
 
 class Array(data.Array, _ItemNode):
     """Array-type data node for the inmem backend."""
-    pass
+    __slots__ = ()
 
 
 class Bytes(_ItemNode):
     """Bytes-type data node for the inmem backend."""
-    pass
+    __slots__ = ()
 
 
 class Bool(_ItemNode):
     """Bool-type data node for the inmem backend."""
-    pass
+    __slots__ = ()
 
 
 class Compilation(data.Compilation):
@@ -61,22 +63,24 @@ class Compilation(data.Compilation):
 
 class Date(data.Date, _ItemNode):
     """Date-type data node for the inmem backend."""
-    pass
+    __slots__ = ()
 
 
 class DateTime(data.DateTime, _ItemNode):
     """DateTime-type data node for the inmem backend."""
-    pass
+    __slots__ = ()
 
 
 class List(data.List):
     """List-type data node for the inmem backend."""
-    pass
+    __slots__ = ()
 
 
 class Scalar(data.Scalar, _ItemNode):
     """Scalar-type data node for the inmem backend."""
 
+    __slots__ = ()
+
     def replace(self, new_value):
         """Completely replace the current node value.
 
@@ -126,9 +130,9 @@ class Storage(storage.Storage):
 
 class String(_ItemNode):
     """String-type data node for the inmem backend."""
-    pass
+    __slots__ = ()
 
 
 class Time(data.Time, _ItemNode):
     """Time-type data node for the inmem backend."""
-    pass
+    __slots__ = ()
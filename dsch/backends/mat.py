@@ -7,17 +7,17 @@ from .. import data, schema
 
 class Array(npz.Array):
     """Array-type data node for the mat backend."""
-    pass
+    __slots__ = ()
 
 
 class Bytes(npz.Bytes):
     """Bytes-type data node for the mat backend."""
-    pass
+    __slots__ = ()
 
 
 class Bool(npz.Bool):
     """Bool-type data node for the mat backend."""
-    pass
+    __slots__ = ()
 
 
 class Compilation(npz.Compilation):
@@ -43,6 +43,7 @@ class Compilation(npz.Compilation):
         if data_storage.shape == ():
             data_storage = data_storage[()]
 
+        module_name = self.__module__
         for node_name, subnode in self.schema_node.subnodes.items():
             # Work around the fact that we cannot use
             # data_storage.get(node_name) because data_storage is not a dict,
@@ -53,23 +54,24 @@ class Compilation(npz.Compilation):
                 node_storage = None
 
             self._subnodes[node_name] = data.data_node_from_schema(
-                subnode, self.__module__, self,
-                data_storage=node_storage)
+                subnode, module_name, self, data_storage=node_storage)
 
 
 class Date(npz.Date):
     """Date-type data node for the mat backend."""
-    pass
+    __slots__ = ()
 
 
 class DateTime(npz.DateTime):
     """DateTime-type data node for the mat backend."""
-    pass
+    __slots__ = ()
 
 
 class List(npz.List):
     """List-type data node for the mat backend."""
 
+    __slots__ = ()
+
     def _init_from_storage(self, data_storage):
         """Initialize List from the given data storage object.
 
@@ -89,11 +91,11 @@ class List(npz.List):
                 or data_storage.shape == ():
             data_storage = np.array([data_storage], dtype=np.object)
 
-        for field in data_storage:
-            subnode = data.data_node_from_schema(self.schema_node.subnode,
-                                                 self.__module__, self,
-                                                 data_storage=field)
-            self._subnodes.append(subnode)
+        subnode_class = self._subnode_class
+        subnode_schema = self.schema_node.subnode
+        self._subnodes = [
+            subnode_class(subnode_schema, self, data_storage=field)
+            for field in data_storage]
 
     def save(self):
         """Export the node data as a data storage object.
@@ -112,7 +114,7 @@ class List(npz.List):
 
 class Scalar(npz.Scalar):
     """Scalar-type data node for the mat backend."""
-    pass
+    __slots__ = ()
 
 
 class Storage(npz.Storage):
@@ -127,6 +129,18 @@ class Storage(npz.Storage):
         data: Top-level data node, providing access to all managed data.
     """
 
+    def __init__(self, storage_path, schema_node=None):
+        """Initialize the interface to a ``.mat`` file.
+
+        Unlike the npz backend, compression and memory-mapping are not
+        supported, since the file is read and written via :mod:`scipy.io`.
+
+        Args:
+            storage_path (str): Path to the storage file.
+            schema_node: Top-level schema node for the data hierarchy.
+        """
+        super().__init__(storage_path, schema_node)
+
     def _load(self):
         """Load an existing file from :attr:`storage_path`."""
         file_ = sio.loadmat(self.storage_path, squeeze_me=True)
@@ -147,9 +161,9 @@ class Storage(npz.Storage):
 
 class String(npz.String):
     """String-type data node for the mat backend."""
-    pass
+    __slots__ = ()
 
 
 class Time(npz.Time):
     """Time-type data node for the mat backend."""
-    pass
+    __slots__ = ()
@@ -3,17 +3,41 @@
 This backend provides support for NumPy's npz format. For details, see
 :func:`numpy.savez`, :func:`numpy.load` and the `corresponding NumPy
 enhancement proposal <https://docs.scipy.org/doc/numpy/neps/npy-format.html>`_.
+
+Files are written as uncompressed zip archives, just like with
+:func:`numpy.savez`. Optionally, the individual arrays can be compressed using
+`Blosc2 <https://www.blosc.org/>`_ (requires the ``blosc2`` package), see
+:class:`Storage`. Compressed arrays are stored as ``.blp`` members instead of
+``.npy`` members, so they are only readable via dsch, not via
+:func:`numpy.load`.
 """
+import collections
+import concurrent.futures
 import datetime
+import io
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+import zipfile
 
 import numpy as np
 
 from .. import data, schema, storage
 
+# Shared, read-only storage objects for Bool nodes.
+_BOOL_TRUE = np.array([True], dtype='bool')
+_BOOL_TRUE.setflags(write=False)
+_BOOL_FALSE = np.array([False], dtype='bool')
+_BOOL_FALSE.setflags(write=False)
+
 
 class _ItemNode(data.ItemNode):
     """Common base class for data nodes for the npz backend."""
 
+    __slots__ = ()
+
     def save(self):
         """Export the node data as a data storage object.
 
@@ -26,6 +50,8 @@ class _ItemNode(data.ItemNode):
 class Array(data.Array, _ItemNode):
     """Array-type data node for the npz backend."""
 
+    __slots__ = ()
+
     def replace(self, new_value):
         """Completely replace the current node value.
 
@@ -38,6 +64,32 @@ class Array(data.Array, _ItemNode):
         """
         self._storage = new_value
 
+    def open_memmap(self, path, shape, dtype=None):
+        """Store the array data in a memory-mapped ``.npy`` file.
+
+        This creates a new, zero-filled ``.npy`` file at ``path`` and replaces
+        the node value by a memory-mapped array of that file, see
+        :func:`numpy.lib.format.open_memmap`. The returned array can then be
+        filled incrementally, without keeping all of the data in memory.
+
+        When saving, the ``.npy`` file is copied into the ``.npz`` file
+        directly, instead of serializing the array again. The ``.npy`` file
+        is not removed afterwards.
+
+        Args:
+            path (str): Path to the ``.npy`` file to create.
+            shape (tuple): Array shape.
+            dtype: Array data type. Defaults to the schema node's dtype.
+
+        Returns:
+            numpy.memmap: Memory-mapped array, which is the new node value.
+        """
+        if dtype is None:
+            dtype = self.schema_node.dtype
+        self._storage = np.lib.format.open_memmap(path, mode='w+',
+                                                  dtype=dtype, shape=shape)
+        return self._storage
+
     def _value(self):
         """Return the actual node data, independent of the backend in use.
 
@@ -50,6 +102,8 @@ class Array(data.Array, _ItemNode):
 class Bytes(_ItemNode):
     """Bytes-type data node for the npz backend."""
 
+    __slots__ = ()
+
     def replace(self, new_value):
         """Completely replace the current node value.
 
@@ -74,6 +128,18 @@ class Bytes(_ItemNode):
 class Bool(_ItemNode):
     """Bool-type data node for the npz backend."""
 
+    __slots__ = ()
+
+    def _init_from_storage(self, data_storage):
+        """Create a new data node from a data storage object.
+
+        This initializes the data node using the given data storage object.
+
+        Args:
+            data_storage: Backend-specific data storage object to load.
+        """
+        self.replace(bool(data_storage))
+
     def replace(self, new_value):
         """Completely replace the current node value.
 
@@ -84,7 +150,7 @@ class Bool(_ItemNode):
             new_value: New value to apply to the node, independent of the
                 backend in use.
         """
-        self._storage = np.array([new_value], dtype='bool')
+        self._storage = _BOOL_TRUE if new_value else _BOOL_FALSE
 
     def _value(self):
         """Return the actual node data, independent of the backend in use.
@@ -92,7 +158,8 @@ class Bool(_ItemNode):
         Returns:
             Node data.
         """
-        return bool(self._storage)
+        # The storage object is always one of the shared module-level arrays.
+        return self._storage is _BOOL_TRUE
 
 
 class Compilation(data.Compilation):
@@ -108,16 +175,15 @@ class Compilation(data.Compilation):
         Returns:
             dict: Data storage object with the node's data.
         """
-        data_storage = {}
-        for name, node in [(na, no) for na, no in self._subnodes.items()
-                           if not no.empty]:
-            data_storage[name] = node.save()
-        return data_storage
+        return {name: node.save() for name, node in self._subnodes.items()
+                if not node.empty}
 
 
 class Date(data.Date, _ItemNode):
     """Date-type data node for the npz backend."""
 
+    __slots__ = ()
+
     def replace(self, new_value):
         """Completely replace the current node value.
 
@@ -143,6 +209,8 @@ class Date(data.Date, _ItemNode):
 class DateTime(data.DateTime, _ItemNode):
     """DateTime-type data node for the npz backend."""
 
+    __slots__ = ()
+
     def replace(self, new_value):
         """Completely replace the current node value.
 
@@ -170,6 +238,8 @@ class DateTime(data.DateTime, _ItemNode):
 class List(data.List):
     """List-type data node for the npz backend."""
 
+    __slots__ = ()
+
     def save(self):
         """Export the node data as a data storage object.
 
@@ -180,15 +250,15 @@ class List(data.List):
         Returns:
             dict: Data storage object with the node's data.
         """
-        data_storage = {}
-        for idx, node in enumerate(self._subnodes):
-            data_storage['item_{}'.format(idx)] = node.save()
-        return data_storage
+        return {data._item_name(idx): node.save()
+                for idx, node in enumerate(self._subnodes)}
 
 
 class Scalar(data.Scalar, _ItemNode):
     """Scalar-type data node for the npz backend."""
 
+    __slots__ = ()
+
     def _init_from_storage(self, data_storage):
         """Create a new data node from a data storage object.
 
@@ -230,13 +300,81 @@ class Storage(storage.FileStorage):
         storage_path (str): Path to the current storage.
         schema_node: Top-level schema node used for the stored data.
         data: Top-level data node, providing access to all managed data.
+        compression (str): Compression applied to the arrays when saving. See
+            :meth:`__init__` for the supported values.
+        mmap_mode (str): Memory-mapping mode used for loading the file.
+        verify_checksums (bool): Whether the CRC-32 checksums of the stored
+            arrays are verified when loading the file.
     """
 
+    def __init__(self, storage_path, schema_node=None, compression=None,
+                 mmap_mode=None, verify_checksums=True):
+        """Initialize the interface to an ``.npz`` file.
+
+        By default, arrays are stored uncompressed, which is by far the
+        fastest option. For compressible data, Blosc2 compression can be
+        selected via ``compression``:
+
+        =============  =============================================
+        Value          Description
+        =============  =============================================
+        ``None``       No compression (default)
+        ``blosc-lz4``  Blosc2 with LZ4 codec, optimized for speed
+        ``zstd``       Blosc2 with Zstandard codec, smaller files
+        =============  =============================================
+
+        Loading compressed files works independently of this setting.
+
+        When loading an existing file, the uncompressed arrays can be
+        memory-mapped instead of being read into memory, by setting
+        ``mmap_mode`` to ``'r'`` (read-only) or ``'c'`` (copy-on-write), see
+        :class:`numpy.memmap`. Data is then only read from disk when it is
+        actually accessed, which is useful for large files of which only parts
+        are required. Mode ``'r+'`` is not supported, since writing to the
+        mapped arrays would leave the checksums in the file outdated.
+        When saving, the file is not overwritten in place, but replaced by a
+        new file, so that the memory-mapped data remains valid.
+
+        .. note::
+            On Windows, files cannot be replaced while they are memory-mapped,
+            so memory-mapped files cannot be saved under their original path.
+
+        By default, the CRC-32 checksums stored in the file are verified when
+        loading, so that corrupted files are detected. Checksumming every byte
+        takes considerably longer than the actual reading, so for trusted
+        files, verification can be skipped by setting ``verify_checksums`` to
+        ``False``. Memory-mapped arrays are never verified, as this would
+        require reading all of their data.
+
+        Args:
+            storage_path (str): Path to the storage file.
+            schema_node: Top-level schema node for the data hierarchy.
+            compression (str): Compression to apply when saving.
+            mmap_mode (str): Memory-mapping mode for loading, if any.
+            verify_checksums (bool): Whether to verify checksums on loading.
+
+        Raises:
+            ValueError: if ``compression`` or ``mmap_mode`` are not
+                supported.
+            ImportError: if compression is requested, but the ``blosc2``
+                package is not available.
+        """
+        if compression is not None:
+            # Fail early, not only when trying to save the data.
+            _codec(compression)
+        if mmap_mode not in (None, 'r', 'c'):
+            raise ValueError('Unsupported mmap_mode: {}'.format(mmap_mode))
+        self.compression = compression
+        self.mmap_mode = mmap_mode
+        self.verify_checksums = verify_checksums
+        super().__init__(storage_path, schema_node)
+
     def _load(self):
         """Load an existing file from :attr:`storage_path`."""
-        with np.load(self.storage_path) as file_:
-            self.schema_node = schema.node_from_json(file_['_schema'][()])
-            stored_data = _inflate_dotted(file_)
+        stored_data = _inflate_dotted(_loadz(self.storage_path,
+                                             self.mmap_mode,
+                                             self.verify_checksums))
+        self.schema_node = schema.node_from_json(stored_data['_schema'][()])
 
         if isinstance(self.schema_node, schema.Compilation):
             data_storage = {k: v for k, v in stored_data.items()
@@ -266,12 +404,53 @@ class Storage(storage.FileStorage):
                 store_data = _flatten_dotted({'data': output_data})
             else:
                 store_data = {}
-        np.savez(self.storage_path, _schema=self.schema_node.to_json(),
-                 **store_data)
+        store_data['_schema'] = self.schema_node.to_json()
+        if self.mmap_mode is not None and os.path.exists(self.storage_path):
+            # Memory-mapped data may still refer to the existing file, so it
+            # must not be truncated. Write a new file and replace the old one.
+            directory, name = os.path.split(os.path.abspath(self.storage_path))
+            handle, temp_path = tempfile.mkstemp(prefix='.' + name + '.',
+                                                 suffix='.tmp', dir=directory)
+            os.close(handle)
+            try:
+                shutil.copymode(self.storage_path, temp_path)
+                _savez(temp_path, store_data, self.compression)
+                os.replace(temp_path, self.storage_path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        else:
+            _savez(self.storage_path, store_data, self.compression)
 
 
 class String(_ItemNode):
-    """String-type data node for the npz backend."""
+    """String-type data node for the npz backend.
+
+    The string is held as a regular :class:`str` and only converted to a NumPy
+    array when saving.
+    """
+
+    # Storage object and corresponding array, cached by save().
+    __slots__ = ('_save_cache',)
+
+    def _init_from_storage(self, data_storage):
+        """Create a new data node from a data storage object.
+
+        This initializes the data node using the given data storage object.
+
+        Args:
+            data_storage: Backend-specific data storage object to load.
+        """
+        self._storage = str(data_storage)
+        self._save_cache = (None, None)
+
+    def _init_new(self, new_params):
+        """Initialize new, empty data node.
+
+        Args:
+            new_params: Backend-specific metadata for data node creation.
+        """
+        self._save_cache = (None, None)
 
     def replace(self, new_value):
         """Completely replace the current node value.
@@ -283,7 +462,25 @@ class String(_ItemNode):
             new_value: New value to apply to the node, independent of the
                 backend in use.
         """
-        self._storage = np.array(new_value, dtype='U')
+        if type(new_value) is not str:
+            # Coerce the same way as when storing, e.g. decoding bytes.
+            new_value = str(np.array(new_value, dtype='U'))
+        self._storage = new_value
+
+    def save(self):
+        """Export the node data as a data storage object.
+
+        Returns:
+            numpy.ndarray: Data storage object with the node's data.
+        """
+        if self._storage is None:
+            return None
+        storage, data_storage = self._save_cache
+        if storage is not self._storage:
+            data_storage = np.array(self._storage, dtype='U')
+            data_storage.setflags(write=False)
+            self._save_cache = (self._storage, data_storage)
+        return data_storage
 
     def _value(self):
         """Return the actual node data, independent of the backend in use.
@@ -291,12 +488,14 @@ class String(_ItemNode):
         Returns:
             Node data.
         """
-        return str(self._storage)
+        return self._storage
 
 
 class Time(data.Time, _ItemNode):
     """Time-type data node for the npz backend."""
 
+    __slots__ = ()
+
     def replace(self, new_value):
         """Completely replace the current node value.
 
@@ -340,16 +539,15 @@ def _inflate_dotted(input_dict):
     output_dict = {}
     for key, value in input_dict.items():
         ref = output_dict
-        parts = key.split('.')
-        for part in parts[:-1]:
-            if part not in ref:
-                ref[part] = {}
-            ref = ref[part]
-        ref[parts[-1]] = value
+        part, dot, key = key.partition('.')
+        while dot:
+            ref = ref.setdefault(part, {})
+            part, dot, key = key.partition('.')
+        ref[part] = value
     return output_dict
 
 
-def _flatten_dotted(input_dict, prefix=''):
+def _flatten_dotted(input_dict):
     """Convert nested dict into flat dict with dotted key notation.
 
     Given a nested dict, e.g.
@@ -360,22 +558,378 @@ def _flatten_dotted(input_dict, prefix=''):
         >>> output_dict == {'spam.eggs': 23, 'answer': 42}
         True
 
+    The nested dicts are walked depth-first using an explicit stack of item
+    iterators, so the output keeps the order of the input and no intermediate
+    dicts are created.
+
     Args:
         dict: Nested dict
-        string: Key prefix, used for recursion. Should be left at the default
-            for normal use.
 
     Returns:
         dict: Flattened dict with dotted notation.
     """
     output_dict = {}
-    for key, value in input_dict.items():
-        if prefix:
-            dotted = prefix + '.' + key
-        else:
-            dotted = key
-        if isinstance(value, dict):
-            output_dict.update(_flatten_dotted(value, dotted))
+    stack = [('', iter(input_dict.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            if isinstance(value, dict):
+                stack.append((prefix + key + '.', iter(value.items())))
+                break
+            output_dict[prefix + key] = value
         else:
-            output_dict[dotted] = value
+            stack.pop()
     return output_dict
+
+
+_LOCAL_FILE_HEADER = struct.Struct('<4s2B4HL2L2H')
+
+# Number of threads for compressing arrays while saving, and maximum number
+# of compressed arrays waiting to be written.
+_SAVE_THREADS = 2
+_SAVE_WINDOW = 4
+
+# Maximum size of a single Blosc2 chunk. Larger arrays are compressed into
+# multiple chunks, which are written one at a time.
+_CHUNK_SIZE = 64 * 1024 ** 2
+
+# Buffer size for copying memory-mapped .npy files into an .npz file.
+_COPY_BUFFER_SIZE = 16 * 1024 ** 2
+
+_CODECS = {
+    'blosc-lz4': 'LZ4',
+    'zstd': 'ZSTD',
+}
+
+
+def _codec(compression):
+    """Get the Blosc2 codec for the given compression setting.
+
+    Args:
+        compression (str): Compression setting, see :class:`Storage`.
+
+    Returns:
+        blosc2.Codec: Codec to use for compression.
+
+    Raises:
+        ValueError: if ``compression`` is not supported.
+        ImportError: if the ``blosc2`` package is not available.
+    """
+    if compression not in _CODECS:
+        raise ValueError('Unsupported compression: {}'.format(compression))
+    import blosc2
+    return getattr(blosc2.Codec, _CODECS[compression])
+
+
+def _compress_array(array, compression):
+    """Serialize an array into a compressed ``.blp`` blob.
+
+    Args:
+        array (numpy.ndarray): Array to compress.
+        compression (str): Compression setting, see :class:`Storage`.
+
+    Returns:
+        bytes: Serialized, compressed array.
+    """
+    return b''.join(_compressed_chunks(array, compression))
+
+
+def _compressed_chunks(array, compression):
+    """Serialize an array into a compressed ``.blp`` blob, chunk by chunk.
+
+    The blob consists of a regular ``.npy`` header, describing shape, dtype
+    and memory layout of the array, followed by the array data, compressed as
+    a sequence of Blosc2 chunks of up to :data:`_CHUNK_SIZE` bytes each.
+    Every chunk records its size and codec in its own header, so no
+    additional metadata is required for decompression.
+
+    Args:
+        array (numpy.ndarray): Array to compress. Must not be empty.
+        compression (str): Compression setting, see :class:`Storage`.
+
+    Yields:
+        bytes: The ``.npy`` header, followed by the compressed chunks.
+    """
+    import blosc2
+    if not (array.flags.c_contiguous or array.flags.f_contiguous):
+        array = np.ascontiguousarray(array)
+    header = io.BytesIO()
+    header_data = np.lib.format.header_data_from_array_1_0(array)
+    np.lib.format.write_array_header_1_0(header, header_data)
+    yield header.getvalue()
+
+    # Fortran-ordered arrays are stored transposed, just like in .npy files.
+    if header_data['fortran_order']:
+        array = array.T
+    buffer = array.reshape(-1).view(np.uint8)
+    itemsize = array.dtype.itemsize
+    step = max(_CHUNK_SIZE // itemsize, 1) * itemsize
+    codec = _codec(compression)
+    typesize = itemsize if itemsize <= blosc2.MAX_TYPESIZE else 1
+    for start in range(0, buffer.size, step):
+        yield blosc2.compress2(buffer[start:start + step], codec=codec,
+                               clevel=1, typesize=typesize)
+
+
+def _decompress_array(file_):
+    """Read an array from a compressed ``.blp`` blob.
+
+    The data is decompressed chunk by chunk, directly into the resulting
+    array.
+
+    Args:
+        file_: File-like object positioned at the start of the blob.
+
+    Returns:
+        numpy.ndarray: Decompressed array.
+    """
+    import blosc2
+    shape, fortran_order, dtype = _read_array_header(file_)
+    array = np.empty(shape, dtype=dtype, order='F' if fortran_order else 'C')
+    buffer = (array.T if fortran_order else array).reshape(-1).view(np.uint8)
+    start = 0
+    while start < buffer.size:
+        chunk = file_.read(blosc2.MIN_HEADER_LENGTH)
+        nbytes, cbytes, _ = blosc2.get_cbuffer_sizes(chunk)
+        chunk += file_.read(cbytes - len(chunk))
+        blosc2.decompress2(chunk, dst=buffer[start:start + nbytes])
+        start += nbytes
+    return array
+
+
+def _read_array_header(file_):
+    """Read an ``.npy`` header from the given file.
+
+    Args:
+        file_: File-like object positioned at the start of the header.
+
+    Returns:
+        tuple: Shape, Fortran order flag and dtype of the array.
+    """
+    version = np.lib.format.read_magic(file_)
+    if version == (1, 0):
+        return np.lib.format.read_array_header_1_0(file_)
+    return np.lib.format.read_array_header_2_0(file_)
+
+
+def _member_offset(file_, info):
+    """Determine the file offset of a zip member's data.
+
+    The member data starts right after the member's local file header, which
+    has a variable length.
+
+    Args:
+        file_: Zip file, opened in binary mode.
+        info (zipfile.ZipInfo): Member to locate.
+
+    Returns:
+        int: Offset of the member data, relative to the start of the file.
+
+    Raises:
+        zipfile.BadZipFile: if the local file header is invalid.
+    """
+    file_.seek(info.header_offset)
+    header = _LOCAL_FILE_HEADER.unpack(file_.read(_LOCAL_FILE_HEADER.size))
+    if header[0] != b'PK\x03\x04':
+        raise zipfile.BadZipFile('Bad magic number for file header')
+    # The last two fields hold the lengths of file name and extra field.
+    return info.header_offset + _LOCAL_FILE_HEADER.size + sum(header[-2:])
+
+
+def _map_array(file_, mapped_file):
+    """Create an array from a memory-mapped ``.npy`` member.
+
+    Args:
+        file_: Zip file, opened in binary mode and positioned at the start of
+            the ``.npy`` member.
+        mapped_file (numpy.memmap): Memory map of the entire zip file.
+
+    Returns:
+        numpy.memmap: Array, referring to the memory-mapped data.
+
+    Raises:
+        ValueError: if the array cannot be memory-mapped.
+    """
+    shape, fortran_order, dtype = _read_array_header(file_)
+    if dtype.hasobject:
+        raise ValueError('Object arrays cannot be memory-mapped.')
+    start = file_.tell()
+    size = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+    return mapped_file[start:start + size].view(dtype).reshape(
+        shape, order='F' if fortran_order else 'C')
+
+
+def _loadz(path, mmap_mode=None, verify_checksums=True):
+    """Load all arrays from an ``.npz`` file.
+
+    In addition to the regular ``.npy`` members, this also supports the
+    compressed ``.blp`` members written by :func:`_savez`.
+
+    Members are read via :mod:`zipfile`, which verifies their CRC-32
+    checksums. If ``verify_checksums`` is ``False``, uncompressed members
+    (i.e. everything written by dsch or :func:`numpy.savez`) are instead read
+    directly from the underlying file, which is considerably faster.
+
+    If ``mmap_mode`` is given, the file is memory-mapped once and all
+    uncompressed ``.npy`` members are returned as views into this memory map,
+    without verifying their checksums.
+
+    Args:
+        path (str): Path to the ``.npz`` file.
+        mmap_mode (str): Memory-mapping mode, see :class:`numpy.memmap`.
+        verify_checksums (bool): Whether to verify the members' checksums.
+
+    Returns:
+        dict: Arrays, with the member names (without extension) as keys.
+
+    Raises:
+        zipfile.BadZipFile: if a checksum does not match.
+    """
+    arrays = {}
+    mapped_file = None
+    if mmap_mode is not None:
+        mapped_file = np.memmap(path, dtype=np.uint8, mode=mmap_mode)
+    with open(path, 'rb') as file_, zipfile.ZipFile(file_) as zip_file:
+        for info in zip_file.infolist():
+            name, ext = os.path.splitext(info.filename)
+            if ext not in ('.npy', '.blp'):
+                continue
+            stored = (info.compress_type == zipfile.ZIP_STORED and
+                      not info.flag_bits & 0x1)
+            if stored and ext == '.npy' and mapped_file is not None:
+                file_.seek(_member_offset(file_, info))
+                arrays[name] = _map_array(file_, mapped_file)
+            elif stored and not verify_checksums:
+                file_.seek(_member_offset(file_, info))
+                if ext == '.npy':
+                    arrays[name] = np.lib.format.read_array(file_)
+                else:
+                    arrays[name] = _decompress_array(file_)
+            else:
+                with zip_file.open(info) as member:
+                    if ext == '.npy':
+                        arrays[name] = np.lib.format.read_array(member)
+                    else:
+                        arrays[name] = _decompress_array(member)
+                    # The checksum is only verified once the end of the
+                    # member has been reached.
+                    member.read()
+    return arrays
+
+
+def _savez(path, arrays, compression=None):
+    """Save arrays into an uncompressed ``.npz`` file.
+
+    This is equivalent to :func:`numpy.savez`, except that the individual
+    arrays can optionally be compressed with Blosc2. The zip archive itself is
+    never compressed, because zip's deflate is slow compared to both, disk
+    I/O and Blosc2.
+
+    With compression, multiple arrays are compressed in background threads
+    while the previous ones are being written, so that compression and disk
+    I/O overlap. At most :data:`_SAVE_WINDOW` compressed arrays are held in
+    memory at the same time. Arrays larger than :data:`_CHUNK_SIZE` are
+    compressed and written chunk by chunk instead, so that no compressed copy
+    of the entire array is held in memory.
+
+    Args:
+        path (str): Path to the ``.npz`` file.
+        arrays (dict): Arrays to save, with the member names as keys.
+        compression (str): Compression setting, see :class:`Storage`.
+    """
+    with zipfile.ZipFile(path, mode='w', compression=zipfile.ZIP_STORED,
+                         allowZip64=True) as zip_file:
+        if compression is None or len(arrays) < 2:
+            for name, value in arrays.items():
+                _write_member(zip_file, name, np.asanyarray(value),
+                              compression)
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(_SAVE_THREADS) as executor:
+            pending = collections.deque()
+            for name, value in arrays.items():
+                array = np.asanyarray(value)
+                if not 0 < array.nbytes <= _CHUNK_SIZE:
+                    # Keep the order of the members by writing all pending
+                    # ones first.
+                    while pending:
+                        _write_pending(zip_file, pending.popleft())
+                    _write_member(zip_file, name, array, compression)
+                    continue
+                future = executor.submit(_compress_array, array, compression)
+                pending.append((name, future))
+                if len(pending) > _SAVE_WINDOW:
+                    _write_pending(zip_file, pending.popleft())
+            while pending:
+                _write_pending(zip_file, pending.popleft())
+
+
+def _write_member(zip_file, name, array, compression=None):
+    """Write a single array into a zip file.
+
+    The data is streamed into the zip file, so that no serialized copy of the
+    entire array is held in memory. Empty arrays are never compressed.
+
+    Args:
+        zip_file (zipfile.ZipFile): Zip file, opened for writing.
+        name (str): Member name, without extension.
+        array (numpy.ndarray): Array to write.
+        compression (str): Compression setting, see :class:`Storage`.
+    """
+    if compression is not None and array.nbytes:
+        with zip_file.open(name + '.blp', mode='w',
+                           force_zip64=True) as member:
+            for chunk in _compressed_chunks(array, compression):
+                member.write(chunk)
+        return
+    npy_path = _npy_path(array)
+    with zip_file.open(name + '.npy', mode='w', force_zip64=True) as member:
+        if npy_path is None:
+            np.lib.format.write_array(member, array, allow_pickle=False)
+        else:
+            array.flush()
+            with open(npy_path, 'rb') as npy_file:
+                shutil.copyfileobj(npy_file, member, _COPY_BUFFER_SIZE)
+
+
+def _write_pending(zip_file, pending):
+    """Write an array compressed in the background into a zip file.
+
+    Args:
+        zip_file (zipfile.ZipFile): Zip file, opened for writing.
+        pending (tuple): Member name and :class:`concurrent.futures.Future`,
+            resulting in the compressed array.
+    """
+    name, future = pending
+    zip_file.writestr(name + '.blp', future.result())
+
+
+def _npy_path(array):
+    """Get the ``.npy`` file that an array is memory-mapped from.
+
+    This only succeeds if the array maps the entire data of an ``.npy`` file,
+    as created by :meth:`Array.open_memmap`, so that the file can be copied
+    instead of serializing the array. Views of such arrays, e.g. as kept by
+    :meth:`~dsch.data.Array.resize` when shrinking, do not qualify.
+
+    Args:
+        array (numpy.ndarray): Array to check.
+
+    Returns:
+        str: Path to the ``.npy`` file, or ``None`` if there is none.
+    """
+    if not isinstance(array, np.memmap) \
+            or not isinstance(array.base, mmap.mmap) or not array.filename:
+        return None
+    try:
+        with open(array.filename, 'rb') as npy_file:
+            shape, fortran_order, dtype = _read_array_header(npy_file)
+            offset = npy_file.tell()
+    except (OSError, ValueError):
+        return None
+    header_data = {'shape': shape, 'fortran_order': fortran_order,
+                   'descr': np.lib.format.dtype_to_descr(dtype)}
+    if offset != array.offset \
+            or header_data != np.lib.format.header_data_from_array_1_0(array):
+        return None
+    return array.filename
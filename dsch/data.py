@@ -12,15 +12,17 @@ common functionality and are intended to be used as base classes.
 Different backends are implemented in the :mod:`dsch.backends` package.
 """
 import datetime
+import functools
 import importlib
+import io
 
-import asciitree
+import numpy as np
 
 from . import exceptions
 
-draw_tree = asciitree.LeftAligned(
-    draw=asciitree.BoxStyle(gfx=asciitree.drawing.BOX_LIGHT, horiz_len=1)
-)
+# Maximum depth of the node tree shown by repr(). Deeper sub-nodes are
+# abbreviated by "...". None means unlimited.
+MAX_REPR_DEPTH = None
 
 
 class ItemNode:
@@ -43,6 +45,8 @@ class ItemNode:
         value: Actual node data, independent of the backend in use.
     """
 
+    __slots__ = ('schema_node', 'parent', '_storage')
+
     def __init__(self, schema_node, parent, data_storage=None,
                  new_params=None):
         """Initialize data node from a given schema node.
@@ -156,9 +160,19 @@ class ItemNode:
         Args:
             source_node: Data node to copy value from.
         """
-        if source_node.schema_node.hash() != self.schema_node.hash():
-            raise exceptions.IncompatibleNodesError(
-                source_node.schema_node.hash(), self.schema_node.hash())
+        _check_compatible(source_node, self)
+        self._load_from_unchecked(source_node)
+
+    def _load_from_unchecked(self, source_node):
+        """Load data by copying from the given source node.
+
+        Like :meth:`load_from`, but without checking node compatibility. This
+        is used when loading sub-nodes, whose compatibility is already implied
+        by that of their parent nodes.
+
+        Args:
+            source_node: Data node to copy value from.
+        """
         self.replace(source_node.value)
 
     def node_tree(self):
@@ -175,13 +189,19 @@ class ItemNode:
         Returns:
             dict: {label: sub_tree} representation.
         """
+        return {self._label(): {}}
+
+    def _label(self):
+        """Return the node's label, as used by :meth:`node_tree`.
+
+        Returns:
+            str: Node type in parentheses, followed by the value.
+        """
         try:
             value = str(self.value)
         except exceptions.NodeEmptyError:
             value = '<empty>'
-        key = '({type_name}): {value}'.format(type_name=type(self).__name__,
-                                              value=value)
-        return {key: {}}
+        return f'({type(self).__name__}): {value}'
 
     def replace(self, new_value):
         """Completely replace the current node value.
@@ -196,7 +216,7 @@ class ItemNode:
         raise NotImplementedError('To be implemented in subclass.')
 
     def __repr__(self):
-        return draw_tree(self.node_tree())
+        return _draw_tree(self, MAX_REPR_DEPTH)
 
     def validate(self):
         """Validate the node value against the schema node specification.
@@ -259,39 +279,99 @@ class Array(ItemNode):
     Backend-specific subclasses should derive from this class.
     """
 
+    __slots__ = ()
+
+    def __array__(self, dtype=None, copy=None):
+        """Support conversion to NumPy arrays, e.g. via numpy.asarray.
+
+        Raises:
+            ValueError: if ``copy`` is ``False``, but a copy is required for
+                converting to the requested ``dtype``.
+        """
+        if copy:
+            return np.array(self.value, dtype=dtype, copy=True)
+        value = self.value
+        if copy is False and dtype is not None and \
+                np.dtype(dtype) != value.dtype:
+            raise ValueError('Unable to avoid copy while converting to the '
+                             'requested dtype.')
+        return np.asarray(value, dtype=dtype)
+
+    @property
+    def dtype(self):
+        """numpy.dtype: Data type of the array elements."""
+        if self._storage is None:
+            raise exceptions.NodeEmptyError()
+        return self._storage.dtype
+
     def __getitem__(self, key):
         """Pass slicing/indexing operations directly to NumPy array."""
         return self._storage[key]
 
-    def node_tree(self):
-        """Return a recursive representation of the (sub)node-tree.
+    @property
+    def ndim(self):
+        """int: Number of array dimensions."""
+        if self._storage is None:
+            raise exceptions.NodeEmptyError()
+        return self._storage.ndim
 
-        The representation is a dict with the node's own label as the key and
-        the tree of sub-nodes as the value. The label always starts with the
-        node type in parentheses.
+    def _label(self):
+        """Return the node's label, as used by :meth:`node_tree`.
 
         For Array nodes, the value is *not* included in the label because of
-        its length. Instead, the array shape is shown. If no value is set,
+        its length. Instead, the array shape is shown, which is taken from the
+        storage object without reading the data. If no value is set,
         '<empty>' is printed instead.
 
         Returns:
-            dict: {label: sub_tree} representation.
+            str: Node type in parentheses, followed by the array shape.
         """
         try:
-            value = 'x'.join([str(l) for l in self.value.shape]) + ' array'
+            value = 'x'.join(map(str, self.shape)) + ' array'
         except exceptions.NodeEmptyError:
             value = '<empty>'
-        key = '({type_name}): {value}'.format(type_name=type(self).__name__,
-                                              value=value)
-        return {key: {}}
+        return f'({type(self).__name__}): {value}'
 
     def resize(self, size):
         """Resize the array to the desired size.
 
+        Resizing is done per dimension, like for HDF5 datasets, i.e. existing
+        data keeps its position in the array, and new elements are
+        zero-filled. If the number of dimensions changes, the data is copied
+        in flat (C) order instead, as with :meth:`numpy.ndarray.resize`.
+
+        Shrinking does not reallocate, but keeps a view of the remaining part
+        of the array. Note that this view still holds the memory of the entire
+        original array. To release it, replace the node value with a copy,
+        e.g. ``node.value = node.value.copy()``.
+
         Args:
             size (tuple): Desired array size.
         """
-        self._storage.resize(size)
+        if isinstance(size, int):
+            size = (size,)
+        old_array = self._storage
+        if len(size) != old_array.ndim:
+            new_array = np.zeros(size, dtype=old_array.dtype)
+            count = min(old_array.size, new_array.size)
+            new_array.flat[:count] = old_array.ravel()[:count]
+            self._storage = new_array
+            return
+        common = tuple(slice(0, min(old, new))
+                       for old, new in zip(old_array.shape, size))
+        if all(new <= old for old, new in zip(old_array.shape, size)):
+            self._storage = old_array[common]
+        else:
+            new_array = np.zeros(size, dtype=old_array.dtype)
+            new_array[common] = old_array[common]
+            self._storage = new_array
+
+    @property
+    def shape(self):
+        """tuple: Array dimensions."""
+        if self._storage is None:
+            raise exceptions.NodeEmptyError()
+        return self._storage.shape
 
     def __setitem__(self, key, value):
         """Pass slicing/indexing operations directly to NumPy array."""
@@ -309,11 +389,13 @@ class Array(ItemNode):
         if self._storage is None:
             return
         independent_values = []
-        node_names = self.schema_node.depends_on or []
-        for node_name in node_names:
-            if node_name:
-                independent_values.append(getattr(self.parent, node_name)
-                                          .value)
+        if self.schema_node.depends_on:
+            # Look up the independent variables directly in the parent
+            # Compilation, avoiding the detour via attribute access.
+            siblings = self.parent._subnodes
+            independent_values = [siblings[node_name].value
+                                  for node_name in self.schema_node.depends_on
+                                  if node_name]
         self.schema_node.validate(self.value, independent_values)
 
 
@@ -360,6 +442,13 @@ class Compilation:
             self._init_from_storage(data_storage)
         else:
             self._init_new(new_params)
+        # Bind the sub-nodes as instance attributes, so that accessing them
+        # does not require the detour via __getattr__. Names that are used by
+        # the class itself (e.g. methods) take precedence, as before.
+        for node_name, subnode in self._subnodes.items():
+            if node_name not in self.__dict__ \
+                    and not hasattr(type(self), node_name):
+                object.__setattr__(self, node_name, subnode)
 
     def clear(self):
         """Clear all sub-node values.
@@ -391,12 +480,11 @@ class Compilation:
         Returns:
             bool: ``True`` if the Compilation is complete, ``False`` otherwise.
         """
-        required_nodes = [node for name, node in self._subnodes.items()
-                          if name not in self.schema_node.optionals]
-        for node in required_nodes:
-            if not node.complete:
-                return False
-        return True
+        # The optionals are read once per call, not per sub-node, but not
+        # cached across calls, since the schema node may still be changed.
+        optionals = frozenset(self.schema_node.optionals)
+        return all(node.complete for name, node in self._subnodes.items()
+                   if name not in optionals)
 
     def data_tree(self, include_empty=False):
         """Return a recursive representation of the (sub)node data.
@@ -420,12 +508,6 @@ class Compilation:
                 tree[name] = subnode_data
         return tree
 
-    def __dir__(self):
-        """Include sub-nodes in :func:`dir`."""
-        attrs = super().__dir__()
-        attrs.extend(self._subnodes.keys())
-        return attrs
-
     @property
     def empty(self):
         """Check whether the Compilation is currently empty.
@@ -436,17 +518,23 @@ class Compilation:
         Returns:
             bool: ``True`` if the Compilation is empty, ``False`` otherwise.
         """
-        for node in self._subnodes.values():
-            if not node.empty:
-                return False
-        return True
+        return all(node.empty for node in self._subnodes.values())
 
     def __getattr__(self, attr_name):
         """Return sub-nodes via the dot-attribute syntax.
 
         This returns the entire sub-node object, not just the node value.
+
+        Sub-nodes are bound as instance attributes during initialization,
+        except for those whose names clash with existing attributes. The
+        sub-nodes are fixed by the schema, so this is only a fallback for
+        sub-nodes that were not bound, e.g. while the Compilation is still
+        being initialized.
         """
-        return self._subnodes[attr_name]
+        try:
+            return self.__dict__['_subnodes'][attr_name]
+        except KeyError:
+            raise AttributeError(attr_name) from None
 
     def _init_from_storage(self, data_storage):
         """Initialize Compilation from the given data storage object.
@@ -462,11 +550,12 @@ class Compilation:
         Args:
             data_storage (dict): Backend-specific data storage object to load.
         """
-        for node_name, subnode in self.schema_node.subnodes.items():
-            node_storage = data_storage.get(node_name, None)
-            self._subnodes[node_name] = data_node_from_schema(
-                subnode, self.__module__, self,
-                data_storage=node_storage)
+        module_name = self.__module__
+        self._subnodes = {
+            node_name: data_node_from_schema(
+                subnode, module_name, self,
+                data_storage=data_storage.get(node_name, None))
+            for node_name, subnode in self.schema_node.subnodes.items()}
 
     def _init_new(self, new_params):
         """Initialize new, empty Compilation.
@@ -477,9 +566,17 @@ class Compilation:
         Args:
             new_params: Backend-specific metadata for data node creation.
         """
-        for node_name, subnode in self.schema_node.subnodes.items():
-            self._subnodes[node_name] = data_node_from_schema(
-                subnode, self.__module__, self)
+        module_name = self.__module__
+        self._subnodes = {
+            node_name: data_node_from_schema(subnode, module_name, self)
+            for node_name, subnode in self.schema_node.subnodes.items()}
+
+    def __iter__(self):
+        """Iterate over the sub-nodes, in the order given by the schema.
+
+        This yields the entire sub-node objects, not just the node values.
+        """
+        return iter(self._subnodes.values())
 
     def load_from(self, source_node):
         """Load data by copying from the given source node.
@@ -489,11 +586,19 @@ class Compilation:
         Args:
             source_node: Data node to copy value from.
         """
-        if source_node.schema_node.hash() != self.schema_node.hash():
-            raise exceptions.IncompatibleNodesError(
-                source_node.schema_node.hash(), self.schema_node.hash())
+        _check_compatible(source_node, self)
+        self._load_from_unchecked(source_node)
+
+    def _load_from_unchecked(self, source_node):
+        """Load data by copying from the given source node.
+
+        Like :meth:`load_from`, but without checking node compatibility.
+
+        Args:
+            source_node: Data node to copy value from.
+        """
         for key, subnode in self._subnodes.items():
-            subnode.load_from(getattr(source_node, key))
+            subnode._load_from_unchecked(getattr(source_node, key))
 
     def node_tree(self):
         """Return a recursive representation of the (sub)node-tree.
@@ -510,10 +615,18 @@ class Compilation:
         """
         tree = {}
         for name, subnode in self._subnodes.items():
-            for sub_label, sub_tree in subnode.node_tree().items():
-                key = '{name} {label}'.format(name=name, label=sub_label)
-                tree[key] = sub_tree
-        return {'(Compilation)': tree}
+            # Each sub-node's tree has exactly one entry: its own label.
+            (sub_label, sub_tree), = subnode.node_tree().items()
+            tree[f'{name} {sub_label}'] = sub_tree
+        return {self._label(): tree}
+
+    def _label(self):
+        """Return the node's label, as used by :meth:`node_tree`.
+
+        Returns:
+            str: Node type in parentheses.
+        """
+        return '(Compilation)'
 
     def replace(self, new_value):
         """Replace the current compilation values with new ones.
@@ -532,7 +645,7 @@ class Compilation:
             self._subnodes[key].replace(value)
 
     def __repr__(self):
-        return draw_tree(self.node_tree())
+        return _draw_tree(self, MAX_REPR_DEPTH)
 
     def __setattr__(self, attr_name, new_value):
         """Prevent accidental (re-)setting of sub-nodes.
@@ -579,6 +692,8 @@ class Date(ItemNode):
     Backend-specific subclasses should derive from this class.
     """
 
+    __slots__ = ()
+
     def _init_new(self, new_params):
         """Initialize new Date data node.
 
@@ -602,6 +717,8 @@ class DateTime(ItemNode):
     Backend-specific subclasses should derive from this class.
     """
 
+    __slots__ = ()
+
     def _init_new(self, new_params):
         """Initialize new DateTime data node.
 
@@ -634,6 +751,8 @@ class List:
         empty: Data absence flag. ``True`` if no data is present.
     """
 
+    __slots__ = ('schema_node', 'parent', '_subnodes', '_subnode_class')
+
     def __init__(self, schema_node, parent, data_storage=None,
                  new_params=None):
         """Initialize list node from a given schema node.
@@ -655,6 +774,10 @@ class List:
         self.schema_node = schema_node
         self.parent = parent
         self._subnodes = []
+        # All sub-nodes share the same type, so the data node class for the
+        # backend in use is only looked up once.
+        self._subnode_class = _node_class(self.__module__,
+                                          type(schema_node.subnode).__name__)
         if data_storage is not None:
             self._init_from_storage(data_storage)
         else:
@@ -670,8 +793,7 @@ class List:
         Args:
             value: Value to be added to the list.
         """
-        subnode = data_node_from_schema(self.schema_node.subnode,
-                                        self.__module__, self)
+        subnode = self._new_subnode()
         self._subnodes.append(subnode)
         if value is not None:
             subnode.replace(value)
@@ -697,10 +819,7 @@ class List:
         Returns:
             bool: ``True`` if the List is complete, ``False`` otherwise.
         """
-        for node in self._subnodes:
-            if not node.complete:
-                return False
-        return True
+        return all(node.complete for node in self._subnodes)
 
     def data_tree(self, include_empty=False):
         """Return a recursive representation of the (sub)node data.
@@ -735,10 +854,25 @@ class List:
         Returns:
             bool: ``True`` if the List is empty, ``False`` otherwise.
         """
-        for subnode in self._subnodes:
-            if not subnode.empty:
-                return False
-        return True
+        return all(subnode.empty for subnode in self._subnodes)
+
+    def extend(self, values):
+        """Append new data nodes to the list, one for each of the values.
+
+        This is equivalent to calling :meth:`append` for each value, but
+        avoids the per-call overhead. As for :meth:`append`, a value of
+        ``None`` results in an empty data node.
+
+        Args:
+            values: Iterable of values to be added to the list.
+        """
+        new_subnode = self._new_subnode
+        subnodes = self._subnodes
+        for value in values:
+            subnode = new_subnode()
+            subnodes.append(subnode)
+            if value is not None:
+                subnode.replace(value)
 
     def __getitem__(self, item):
         """Return subnodes via the brackets syntax.
@@ -747,6 +881,13 @@ class List:
         """
         return self._subnodes[item]
 
+    def __iter__(self):
+        """Iterate over the sub-nodes.
+
+        This yields the entire sub-node objects, not just the node values.
+        """
+        return iter(self._subnodes)
+
     def __len__(self):
         """Return the length of the List, i.e. the number of subnodes."""
         return len(self._subnodes)
@@ -765,12 +906,12 @@ class List:
         Args:
             data_storage (dict): Backend-specific data storage object to load.
         """
-        for idx in range(len(data_storage)):
-            node_storage = data_storage['item_{}'.format(idx)]
-            subnode = data_node_from_schema(self.schema_node.subnode,
-                                            self.__module__, self,
-                                            data_storage=node_storage)
-            self._subnodes.append(subnode)
+        subnode_class = self._subnode_class
+        subnode_schema = self.schema_node.subnode
+        self._subnodes = [
+            subnode_class(subnode_schema, self,
+                          data_storage=data_storage[_item_name(idx)])
+            for idx in range(len(data_storage))]
 
     def _init_new(self, new_params):
         """Initialize new, empty List data node.
@@ -791,12 +932,34 @@ class List:
         Args:
             source_node: Data node to copy value from.
         """
-        if source_node.schema_node.hash() != self.schema_node.hash():
-            raise exceptions.IncompatibleNodesError(
-                source_node.schema_node.hash(), self.schema_node.hash())
-        for idx, subnode in enumerate(source_node):
-            self.append()
-            self[idx].load_from(subnode)
+        _check_compatible(source_node, self)
+        self._load_from_unchecked(source_node)
+
+    def _load_from_unchecked(self, source_node):
+        """Load data by copying from the given source node.
+
+        Like :meth:`load_from`, but without checking node compatibility.
+
+        Args:
+            source_node: Data node to copy value from.
+        """
+        new_subnode = self._new_subnode
+        subnodes = self._subnodes
+        for source_subnode in source_node:
+            subnode = new_subnode()
+            subnodes.append(subnode)
+            subnode._load_from_unchecked(source_subnode)
+
+    def _new_subnode(self):
+        """Create a new, empty sub-node for the next list index.
+
+        The new sub-node is not added to the List. Backend-specific subclasses
+        may override this to pass creation parameters to the new sub-node.
+
+        Returns:
+            New data node for the List's sub-node schema.
+        """
+        return self._subnode_class(self.schema_node.subnode, self)
 
     def node_tree(self):
         """Return a recursive representation of the (sub)node-tree.
@@ -813,26 +976,33 @@ class List:
         """
         tree = {}
         for idx, subnode in enumerate(self._subnodes):
-            for sub_label, sub_tree in subnode.node_tree().items():
-                key = '[{idx}] {label}'.format(idx=idx, label=sub_label)
-                tree[key] = sub_tree
-        return {'(List)': tree}
+            # Each sub-node's tree has exactly one entry: its own label.
+            (sub_label, sub_tree), = subnode.node_tree().items()
+            tree[f'[{idx}] {sub_label}'] = sub_tree
+        return {self._label(): tree}
+
+    def _label(self):
+        """Return the node's label, as used by :meth:`node_tree`.
+
+        Returns:
+            str: Node type in parentheses.
+        """
+        return '(List)'
 
     def replace(self, new_value):
         """Replace the current list entries with the given list of entries.
 
         For :class:`List`, this is effectively a shorthand for calling
-        :meth:`clear` and then, for each of the new entries, :meth:`append`.
+        :meth:`clear` and then :meth:`extend`.
 
         Args:
             new_value (list): New entries to put into the List.
         """
         self.clear()
-        for item in new_value:
-            self.append(item)
+        self.extend(new_value)
 
     def __repr__(self):
-        return draw_tree(self.node_tree())
+        return _draw_tree(self, MAX_REPR_DEPTH)
 
     def __setitem__(self, idx, new_value):
         """Prevent accidental (re-)setting of items.
@@ -877,27 +1047,22 @@ class Scalar(ItemNode):
     Backend-specific subclasses should derive from this class.
     """
 
-    def node_tree(self):
-        """Return a recursive representation of the (sub)node-tree.
+    __slots__ = ()
 
-        The representation is a dict with the node's own label as the key and
-        the tree of sub-nodes as the value. The label always starts with the
-        node type in parentheses.
+    def _label(self):
+        """Return the node's label, as used by :meth:`node_tree`.
 
         For Scalar nodes, the :attr:`~dsch.schema.Scalar.unit` is appended to
         the value, if any. If no value is set, '<empty>' is printed instead.
 
         Returns:
-            dict: {label: sub_tree} representation.
+            str: Node type in parentheses, followed by the value and unit.
         """
         try:
-            value = '{value} {unit}'.format(value=self.value,
-                                            unit=self.schema_node.unit)
+            value = f'{self.value} {self.schema_node.unit}'
         except exceptions.NodeEmptyError:
             value = '<empty>'
-        key = '({type_name}): {value}'.format(type_name=type(self).__name__,
-                                              value=value)
-        return {key: {}}
+        return f'({type(self).__name__}): {value}'
 
 
 class Time(ItemNode):
@@ -907,6 +1072,8 @@ class Time(ItemNode):
     Backend-specific subclasses should derive from this class.
     """
 
+    __slots__ = ()
+
     def _init_new(self, new_params):
         """Initialize new Time data node.
 
@@ -924,6 +1091,42 @@ class Time(ItemNode):
             self.value = datetime.datetime.now().time()
 
 
+def _check_compatible(source_node, dest_node):
+    """Check whether data can be copied between two data nodes.
+
+    Two nodes are considered compatible if their schema nodes are identical,
+    i.e. have the same hash. Since this implies identical schema nodes for all
+    their sub-nodes, checking the top-level nodes is sufficient.
+
+    Args:
+        source_node: Data node to copy data from.
+        dest_node: Data node to copy data to.
+
+    Raises:
+        dsch.exceptions.IncompatibleNodesError: if the nodes are not
+            compatible.
+    """
+    source_hash = source_node.schema_node.hash()
+    dest_hash = dest_node.schema_node.hash()
+    if source_hash != dest_hash:
+        raise exceptions.IncompatibleNodesError(source_hash, dest_hash)
+
+
+def _item_name(idx):
+    """Return the storage name of the :class:`List` item at the given index.
+
+    List items are stored under names of the form "item_X", with X the list
+    index.
+
+    Args:
+        idx (int): List index.
+
+    Returns:
+        str: Storage name of the list item.
+    """
+    return 'item_{}'.format(idx)
+
+
 def data_node_from_schema(schema_node, module_name, parent, data_storage=None,
                           new_params=None):
     """Create a new data node from a given schema node.
@@ -947,8 +1150,76 @@ def data_node_from_schema(schema_node, module_name, parent, data_storage=None,
     Returns:
         Data node corresponding to the given schema node.
     """
-    backend_module = importlib.import_module(module_name)
-    node_type_name = type(schema_node).__name__
-    data_node_type = getattr(backend_module, node_type_name)
+    data_node_type = _node_class(module_name, type(schema_node).__name__)
     return data_node_type(schema_node, parent, data_storage=data_storage,
                           new_params=new_params)
+
+
+@functools.lru_cache(maxsize=None)
+def _node_class(module_name, node_type_name):
+    """Find the data node class for a given node type and backend.
+
+    The result is cached, since this is required for every single data node
+    that is created.
+
+    Args:
+        module_name (str): The full module name of the data storage backend.
+        node_type_name (str): Name of the node type, e.g. ``'Compilation'``.
+
+    Returns:
+        Data node class.
+    """
+    backend_module = importlib.import_module(module_name)
+    return getattr(backend_module, node_type_name)
+
+
+def _draw_tree(node, max_depth=None):
+    """Draw the node tree of the given data node as text.
+
+    The output has the same structure and labels as :meth:`node_tree`, drawn
+    with box-drawing characters. The tree is traversed directly, without
+    building the intermediate dicts.
+
+    Args:
+        node: Top-level data node to draw.
+        max_depth (int): Maximum depth of sub-nodes to draw. Sub-nodes below
+            are abbreviated by "...". If ``None``, the full tree is drawn.
+
+    Returns:
+        str: Drawn tree.
+    """
+    buf = io.StringIO()
+    buf.write(node._label())
+    # Stack of (name, node, indentation, is_last, depth), in reverse order.
+    stack = []
+
+    def push_children(node, indent, depth):
+        if isinstance(node, Compilation):
+            children = [(name + ' ', subnode)
+                        for name, subnode in node._subnodes.items()]
+        elif isinstance(node, List):
+            children = [(f'[{idx}] ', subnode)
+                        for idx, subnode in enumerate(node._subnodes)]
+        else:
+            return
+        if not children:
+            return
+        if max_depth is not None and depth > max_depth:
+            children = [('...', None)]
+        for idx in range(len(children) - 1, -1, -1):
+            name, subnode = children[idx]
+            stack.append((name, subnode, indent, idx == len(children) - 1,
+                          depth))
+
+    push_children(node, '', 1)
+    while stack:
+        name, node, indent, is_last, depth = stack.pop()
+        buf.write('\n')
+        buf.write(indent)
+        buf.write(' └─ ' if is_last else ' ├─ ')
+        buf.write(name)
+        if node is not None:
+            buf.write(node._label())
+            push_children(node, indent + ('   ' if is_last else ' │ '),
+                          depth + 1)
+    return buf.getvalue()
@@ -113,47 +113,62 @@ class SubnodeValidationError(DschError):
         """
         super().__init__()
         self._location = location
+        # Results of node_path() and original_cause(), set by _walk().
+        self._node_path = None
+        self._original_cause = None
 
     def node_path(self):
-        """Recursively determine the path of the node failing validation.
+        """Determine the path of the node failing validation.
+
+        This follows the exception chain, joining the locations of all nested
+        :exc:`SubnodeValidationError` instances.
 
         Returns:
             str: Full name and path of the node that failed validation.
         """
-        cause = self.__cause__
-        if isinstance(cause, SubnodeValidationError):
-            cause_path = cause.node_path()
-            if cause_path.startswith('['):
-                post = cause_path
-            else:
-                post = '.' + cause_path
-        elif isinstance(cause, ValidationError):
-            post = ''
-
-        if isinstance(self._location, str):
-            fmt = '{loc}{post}'
-        elif isinstance(self._location, int):
-            fmt = '[{loc}]{post}'
-        return fmt.format(loc=self._location, post=post)
+        if self._node_path is None:
+            self._walk()
+        return self._node_path
 
     def original_cause(self):
         """Get the exception originally causing the chain.
 
-        This recursively follows the exception chain back to the original
+        This follows the exception chain back to the original
         :exc:`ValidationError` that further describes the problem.
 
         Returns:
             :exc:`ValidationError`: Original cause exception.
         """
-        if isinstance(self.__cause__, SubnodeValidationError):
-            return self.__cause__.original_cause()
-        elif isinstance(self.__cause__, ValidationError):
-            return self.__cause__
+        if self._node_path is None:
+            self._walk()
+        return self._original_cause
+
+    def _walk(self):
+        """Follow the exception chain and cache its node path and cause.
+
+        Both :meth:`node_path` and :meth:`original_cause` are determined in a
+        single pass. The results are cached, since the exception chain does not
+        change after the exception has been raised.
+        """
+        parts = []
+        error = self
+        while isinstance(error, SubnodeValidationError):
+            location = error._location
+            if isinstance(location, int):
+                parts.append(f'[{location}]')
+            elif parts:
+                parts.append('.' + location)
+            else:
+                parts.append(location)
+            error = error.__cause__
+        self._node_path = ''.join(parts)
+        if isinstance(error, ValidationError):
+            self._original_cause = error
 
     def __str__(self):
         """Return a nicely printable string representation."""
-        return 'Node "{node_path}" failed validation: {msg}'.format(
-            node_path=self.node_path(), msg=self.original_cause())
+        return (f'Node "{self.node_path()}" failed validation: '
+                f'{self.original_cause()}')
 
 
 class ValidationError(DschError):
@@ -181,5 +196,5 @@ class ValidationError(DschError):
 
     def __str__(self):
         """Return a nicely printable string representation."""
-        return '{msg} (Expected: {exp}. Got: {got})'.format(
-            msg=self.message, exp=self.expected, got=self.got)
+        return (f'{self.message} (Expected: {self.expected}. '
+                f'Got: {self.got})')
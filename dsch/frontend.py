@@ -11,11 +11,19 @@ created.
 The user front end in this module provides a convenient, backend-independent
 interface for loading from existing dsch storages and creating new ones.
 """
+import functools
 import importlib
-import os
 
 from . import exceptions, schema
 
+# File name extensions used for automatic backend detection.
+_BACKEND_EXTENSIONS = {
+    '.h5': 'hdf5',
+    '.hdf5': 'hdf5',
+    '.mat': 'mat',
+    '.npz': 'npz',
+}
+
 
 def create(storage_path, schema_node, backend=None):
     """Create a new dsch storage.
@@ -49,7 +57,7 @@ def create(storage_path, schema_node, backend=None):
     """
     if not backend:
         backend = _autodetect_backend(storage_path)
-    backend_module = importlib.import_module('dsch.backends.' + backend)
+    backend_module = _backend_module(backend)
     return backend_module.Storage(storage_path=storage_path,
                                   schema_node=schema_node)
 
@@ -79,7 +87,8 @@ def create_from(storage_path, source_storage, backend=None):
 
 
 def load(storage_path, backend=None, required_schema=None,
-         required_schema_hash=None, force=False):
+         required_schema_hash=None, force=False, mmap_mode=None,
+         trust_hash=False, verify_checksums=True):
     """Load a dsch storage from the given path.
 
     Normally, the correct backend is detected automatically by interpreting the
@@ -100,6 +109,19 @@ def load(storage_path, backend=None, required_schema=None,
     that following code, e.g. for data evaluation, can safely depend on the
     structure, datatypes and met constraints.
 
+    For large storages, validation may take a considerable amount of time. If
+    the storage is known to have been written by dsch (which validates before
+    saving) and has not been modified since, ``trust_hash`` can be set to
+    ``True`` to skip validation whenever ``required_schema`` or
+    ``required_schema_hash`` was given and matched. Note that the schema hash
+    only covers the schema, not the data, so this skips checking the data
+    against the schema's constraints.
+
+    For the npz backend, arrays can be memory-mapped instead of being read
+    into memory by passing ``mmap_mode``, and the verification of checksums
+    can be skipped for trusted files by setting ``verify_checksums`` to
+    ``False``, see :class:`dsch.backends.npz.Storage` for details.
+
     Args:
         storage_path (str): Path to the dsch storage (backend-specific).
         backend (str): Backend to be used. By default, perform auto-detection.
@@ -107,30 +129,54 @@ def load(storage_path, backend=None, required_schema=None,
             required schema.
         required_schema_hash (str): SHA256 hash of the required schema.
         force (bool): If ``True``, the automatic validation step is skipped.
+        mmap_mode (str): Memory-mapping mode (npz backend only).
+        trust_hash (bool): If ``True``, the automatic validation step is
+            skipped if the storage's schema matched ``required_schema`` or
+            ``required_schema_hash``.
+        verify_checksums (bool): If ``False``, checksums are not verified
+            (npz backend only).
 
     Returns:
         Storage object.
 
     Raises:
+        ValueError: if ``mmap_mode`` is given or ``verify_checksums`` is
+            ``False`` for a backend other than npz.
         dsch.exceptions.InvalidSchemaError: if the loaded storage's schema does
             not match the schema specified through ``required_schema`` or
             ``required_schema_hash``.
-        dsch.exceptions.ValidationError: if ``force`` was not ``True`` and
+        dsch.exceptions.ValidationError: if validation was not skipped and
             validation failed with a regular node as the top-level node.
-        dsch.exceptions.SubnodeValidationError: if ``force`` was not ``True``
+        dsch.exceptions.SubnodeValidationError: if validation was not skipped
             and validation failed with a :class:`~dsch.data.Compilation` or
             :class:`dsch.data.List` as the top-level schema node.
     """
     if not backend:
         backend = _autodetect_backend(storage_path)
-    backend_module = importlib.import_module('dsch.backends.' + backend)
-    storage = backend_module.Storage(storage_path=storage_path)
-    if required_schema and storage.schema_hash() != required_schema.hash():
-        raise exceptions.InvalidSchemaError(required_schema.hash(),
-                                            storage.schema_hash())
-    if required_schema_hash and storage.schema_hash() != required_schema_hash:
-        raise exceptions.InvalidSchemaError(required_schema_hash,
-                                            storage.schema_hash())
+    backend_module = _backend_module(backend)
+    npz_options = {}
+    if mmap_mode is not None:
+        if backend != 'npz':
+            raise ValueError('Memory-mapping is only supported by the npz '
+                             'backend.')
+        npz_options['mmap_mode'] = mmap_mode
+    if not verify_checksums:
+        if backend != 'npz':
+            raise ValueError('Skipping checksum verification is only '
+                             'supported by the npz backend.')
+        npz_options['verify_checksums'] = False
+    storage = backend_module.Storage(storage_path=storage_path, **npz_options)
+    if required_schema or required_schema_hash:
+        schema_hash = storage.schema_hash()
+        if required_schema:
+            required_hash = required_schema.hash()
+            if schema_hash != required_hash:
+                raise exceptions.InvalidSchemaError(required_hash, schema_hash)
+        if required_schema_hash and schema_hash != required_schema_hash:
+            raise exceptions.InvalidSchemaError(required_schema_hash,
+                                                schema_hash)
+        if trust_hash:
+            force = True
     if not force:
         storage.validate()
     return storage
@@ -219,13 +265,10 @@ class PseudoStorage:
         """
         self._data_storage = data_storage
         self._schema_node = schema_node
-        self._schema_alternatives = []
-        if schema_alternatives:
-            for alt in schema_alternatives:
-                if isinstance(alt, schema.SchemaNode):
-                    self._schema_alternatives.append(alt.hash())
-                else:
-                    self._schema_alternatives.append(alt)
+        self._schema_alternatives = frozenset(
+            alt.hash() if isinstance(alt, schema.SchemaNode) else alt
+            for alt in schema_alternatives or ()
+        )
 
         self.data = None
         self.storage = None
@@ -240,8 +283,9 @@ class PseudoStorage:
         Afterwards, the data is no longer available through :attr:`data`.
         """
         if self.storage:
-            if hasattr(self.storage, 'save') and callable(self.storage.save):
-                self.storage.save()
+            save = getattr(self.storage, 'save', None)
+            if callable(save):
+                save()
             self.storage = None
         self.data = None
         self.schema_node = None
@@ -254,12 +298,21 @@ class PseudoStorage:
         if self.data is not None:
             raise RuntimeError('PseudoStorage is already open.')
         if isinstance(self._data_storage, str):
-            if os.path.exists(self._data_storage):
-                self.storage = load(self._data_storage)
-                self._verify_schema(self.storage.schema_node)
-            else:
+            # Attempting to load right away saves a separate check for the
+            # file's existence. In-memory storages can never be loaded.
+            backend = _autodetect_backend(self._data_storage)
+            self.storage = None
+            if backend != 'inmem':
+                try:
+                    self.storage = load(self._data_storage, backend=backend)
+                except FileNotFoundError:
+                    pass
+                else:
+                    self._verify_schema(self.storage.schema_node)
+            if self.storage is None:
                 self.storage = create(self._data_storage,
-                                      schema_node=self._schema_node)
+                                      schema_node=self._schema_node,
+                                      backend=backend)
             self.data = self.storage.data
         else:
             self.storage = None
@@ -277,10 +330,27 @@ class PseudoStorage:
 
     def _verify_schema(self, schema_node):
         schema_hash = schema_node.hash()
-        if (schema_hash != self._schema_node.hash() and
-                schema_hash not in self._schema_alternatives):
-            raise exceptions.InvalidSchemaError(self._schema_node.hash(),
-                                                schema_hash)
+        if schema_hash in self._schema_alternatives:
+            return
+        expected_hash = self._schema_node.hash()
+        if schema_hash != expected_hash:
+            raise exceptions.InvalidSchemaError(expected_hash, schema_hash)
+
+
+@functools.lru_cache(maxsize=None)
+def _backend_module(backend):
+    """Get the module implementing the given backend.
+
+    The module is only looked up once per backend, so that repeatedly creating
+    or loading storages does not go through the import machinery every time.
+
+    Args:
+        backend (str): Backend name.
+
+    Returns:
+        Backend module, e.g. :mod:`dsch.backends.npz`.
+    """
+    return importlib.import_module('dsch.backends.' + backend)
 
 
 def _autodetect_backend(storage_path):
@@ -297,11 +367,8 @@ def _autodetect_backend(storage_path):
     """
     if storage_path == '::inmem::':
         return 'inmem'
-    elif storage_path.endswith('.npz'):
-        return 'npz'
-    elif storage_path.endswith(('.h5', '.hdf5')):
-        return 'hdf5'
-    if storage_path.endswith('.mat'):
-        return 'mat'
-    else:
-        raise exceptions.AutodetectBackendError(storage_path)
+    _, dot, extension = storage_path.rpartition('.')
+    try:
+        return _BACKEND_EXTENSIONS[dot + extension]
+    except KeyError:
+        raise exceptions.AutodetectBackendError(storage_path) from None
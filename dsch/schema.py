@@ -265,11 +265,16 @@ class Array(SchemaNode):
                 if nominal and actual < nominal:
                     raise ValidationError('Minimum array shape undercut.',
                                           self.min_shape, test_data.shape)
-        if self.max_value is not None and np.any(test_data > self.max_value):
+        # Compare the extreme values instead of the whole array, avoiding a
+        # temporary boolean array. fmax/fmin ignore NaN, like the elementwise
+        # comparison does.
+        if self.max_value is not None and test_data.size \
+                and np.fmax.reduce(test_data, axis=None) > self.max_value:
             raise ValidationError('Maximum array element value exceeded.',
                                   self.max_value,
                                   test_data[test_data > self.max_value])
-        if self.min_value is not None and np.any(test_data < self.min_value):
+        if self.min_value is not None and test_data.size \
+                and np.fmin.reduce(test_data, axis=None) < self.min_value:
             raise ValidationError('Minimum array element value undercut.',
                                   self.min_value,
                                   test_data[test_data < self.min_value])
@@ -337,12 +342,15 @@ class Bytes(SchemaNode):
         if not isinstance(test_data, bytes):
             raise ValidationError('Invalid type/value.', 'bytes',
                                   type(test_data))
-        if self.max_length and len(test_data) > self.max_length:
+        if not (self.max_length or self.min_length):
+            return
+        length = len(test_data)
+        if self.max_length and length > self.max_length:
             raise ValidationError('Maximum bytes length exceeded.',
-                                  self.max_length, len(test_data))
-        if self.min_length and len(test_data) < self.min_length:
+                                  self.max_length, length)
+        if self.min_length and length < self.min_length:
             raise ValidationError('Minimum bytes length undercut.',
-                                  self.min_length, len(test_data))
+                                  self.min_length, length)
 
 
 class Bool(SchemaNode):
@@ -380,7 +388,7 @@ class Bool(SchemaNode):
         Raises:
             dsch.exceptions.ValidationError: if validation fails.
         """
-        if type(test_data) != bool:
+        if type(test_data) is not bool:
             raise ValidationError('Invalid type/value.', 'bool',
                                   type(test_data))
 
@@ -815,12 +823,15 @@ class String(SchemaNode):
         if not isinstance(test_data, str):
             raise ValidationError('Invalid type/value.', 'str',
                                   type(test_data))
-        if self.max_length and len(test_data) > self.max_length:
+        if not (self.max_length or self.min_length):
+            return
+        length = len(test_data)
+        if self.max_length and length > self.max_length:
             raise ValidationError('Maximum string length exceeded.',
-                                  self.max_length, len(test_data))
-        if self.min_length and len(test_data) < self.min_length:
+                                  self.max_length, length)
+        if self.min_length and length < self.min_length:
             raise ValidationError('Minimum string length undercut.',
-                                  self.min_length, len(test_data))
+                                  self.min_length, length)
 
 
 class Time(SchemaNode):
@@ -879,6 +890,11 @@ class Time(SchemaNode):
                                   type(test_data))
 
 
+# Schema node classes by name, as used for the ``node_type`` field.
+_NODE_TYPES = {name: cls for name, cls in globals().items()
+               if inspect.isclass(cls) and issubclass(cls, SchemaNode)}
+
+
 def node_from_dict(node_dict):
     """Create a new node from its ``node_dict``.
 
@@ -891,11 +907,9 @@ def node_from_dict(node_dict):
     Returns:
         New schema node with the specified type and configuration.
     """
-    node_types = {name: cls for name, cls in globals().items()
-                  if inspect.isclass(cls) and issubclass(cls, SchemaNode)}
-    if node_dict['node_type'] not in node_types:
+    node_type = _NODE_TYPES.get(node_dict['node_type'])
+    if node_type is None:
         raise ValueError('Invalid node type specified.')
-    node_type = node_types[node_dict['node_type']]
     return node_type.from_dict(node_dict)
 
 
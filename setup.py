@@ -30,18 +30,18 @@ setup(
 
     # Runtime dependencies
     install_requires=[
-        'asciitree',
         'numpy',
     ],
 
     # Optional dependencies
     extras_require={
+        'Blosc': ['blosc2'],
         'HDF5': ['h5py'],
         'MAT': ['scipy'],
     },
 
     # Python version requirement
-    python_requires='>=3',
+    python_requires='>=3.6',
 
     # Dependencies of this setup script
     setup_requires=[
@@ -1,6 +1,7 @@
 import json
 
 import numpy as np
+import pytest
 import scipy.io as sio
 
 from dsch import schema
@@ -40,6 +41,15 @@ class TestList:
 
 
 class TestStorage:
+    def test_init_npz_options(self, tmpdir):
+        storage_path = str(tmpdir.join('test_init_npz_options.mat'))
+        with pytest.raises(TypeError):
+            mat.Storage(storage_path=storage_path, schema_node=schema.Bool(),
+                        compression='blosc-lz4')
+        with pytest.raises(TypeError):
+            mat.Storage(storage_path=storage_path, schema_node=schema.Bool(),
+                        mmap_mode='r')
+
     def test_load_compilation(self, tmpdir):
         schema_node = schema.Compilation({'spam': schema.Bool(),
                                           'eggs': schema.Bool()})
@@ -1,5 +1,6 @@
 import datetime
 import json
+import zipfile
 
 import numpy as np
 import pytest
@@ -25,6 +26,58 @@ def test_save_item_node(schema_node, valid_data):
     assert np.all(data_node.save() == data_node._storage)
 
 
+class TestArray:
+    def test_open_memmap(self, tmpdir):
+        data_node = npz.Array(schema.Array(dtype='int32'), parent=None)
+        npy_path = str(tmpdir.join('test_open_memmap.npy'))
+        array = data_node.open_memmap(npy_path, (2, 3))
+        array[:] = np.arange(6).reshape(2, 3)
+        assert array.dtype == 'int32'
+        assert data_node.value is array
+        assert npz._npy_path(data_node.value) == npy_path
+        data_node.resize((2, 2))
+        assert npz._npy_path(data_node.value) is None
+
+    def test_resize_shrink(self):
+        data_node = npz.Array(schema.Array(dtype='int32'), parent=None)
+        data_node.value = np.arange(6, dtype='int32').reshape(2, 3)
+        storage = data_node._storage
+        data_node.resize((2, 2))
+        assert np.array_equal(data_node.value, [[0, 1], [3, 4]])
+        assert np.shares_memory(data_node.value, storage)
+
+    def test_resize_grow(self):
+        data_node = npz.Array(schema.Array(dtype='int32'), parent=None)
+        data_node.value = np.arange(6, dtype='int32').reshape(2, 3)
+        data_node.resize((3, 2))
+        assert np.array_equal(data_node.value, [[0, 1], [3, 4], [0, 0]])
+
+    def test_resize_ndim(self):
+        data_node = npz.Array(schema.Array(dtype='int32'), parent=None)
+        data_node.value = np.arange(6, dtype='int32').reshape(2, 3)
+        data_node.resize((7,))
+        assert np.array_equal(data_node.value, [0, 1, 2, 3, 4, 5, 0])
+
+
+def test_save_string():
+    data_node = npz.String(schema.String(), parent=None)
+    data_node.value = 'spam'
+    data_storage = data_node.save()
+    assert isinstance(data_storage, np.ndarray)
+    assert data_storage.dtype.kind == 'U'
+    assert data_storage[()] == 'spam'
+    assert data_node.save() is data_storage
+    data_node.value = 'eggs'
+    assert data_node.save()[()] == 'eggs'
+
+
+def test_string_coercion():
+    data_node = npz.String(schema.String(), parent=None)
+    data_node.value = b'spam'
+    assert data_node.value == 'spam'
+    assert type(data_node.value) is str
+
+
 class TestCompilation:
     def test_init_from_storage(self):
         schema_node = schema.Compilation({'spam': schema.Bool(),
@@ -88,6 +141,96 @@ class TestStorage:
         assert npz_file.data.spam.value is True
         assert npz_file.data.eggs.value is False
 
+    def test_save_memmap(self, tmpdir):
+        schema_node = schema.Compilation({
+            'spam': schema.Array(dtype='float64', max_shape=(None, None)),
+        })
+        storage_path = str(tmpdir.join('test_save_memmap.npz'))
+        npz_file = npz.Storage(storage_path=storage_path,
+                               schema_node=schema_node)
+        array = npz_file.data.spam.open_memmap(
+            str(tmpdir.join('spam.npy')), (100, 3))
+        array[:] = np.arange(300).reshape(100, 3)
+        npz_file.save()
+
+        with np.load(storage_path) as file_:
+            assert np.array_equal(file_['spam'],
+                                  np.arange(300).reshape(100, 3))
+
+    def test_load_corrupted(self, tmpdir):
+        schema_node = schema.Array(dtype='uint8')
+        schema_data = json.dumps(schema_node.to_dict(), sort_keys=True)
+        storage_path = str(tmpdir.join('test_load_corrupted.npz'))
+        test_data = {'data': np.full(64, 0x5a, dtype='uint8'),
+                     '_schema': schema_data}
+        np.savez(storage_path, **test_data)
+        with open(storage_path, 'rb') as file_:
+            content = bytearray(file_.read())
+        content[content.index(b'\x5a' * 64) + 23] ^= 0xff
+        with open(storage_path, 'wb') as file_:
+            file_.write(content)
+
+        with pytest.raises(zipfile.BadZipFile):
+            npz.Storage(storage_path=storage_path)
+        npz_file = npz.Storage(storage_path=storage_path,
+                               verify_checksums=False)
+        assert npz_file.data.value[23] == 0xa5
+
+    def test_load_deflated(self, tmpdir):
+        schema_node = schema.Array(dtype='int32')
+        schema_data = json.dumps(schema_node.to_dict(), sort_keys=True)
+        storage_path = str(tmpdir.join('test_load_deflated.npz'))
+        test_data = {'data': np.arange(100, dtype='int32'),
+                     '_schema': schema_data}
+        np.savez_compressed(storage_path, **test_data)
+
+        npz_file = npz.Storage(storage_path=storage_path)
+        assert np.array_equal(npz_file.data.value, np.arange(100))
+
+    @pytest.mark.parametrize('mmap_mode', ('r', 'c'))
+    def test_load_mmap(self, tmpdir, mmap_mode):
+        schema_node = schema.Compilation({
+            'spam': schema.Array(dtype='float64', max_shape=(None, None)),
+            'eggs': schema.Array(dtype='int32'),
+            'ham': schema.String(),
+        })
+        schema_data = json.dumps(schema_node.to_dict(), sort_keys=True)
+        storage_path = str(tmpdir.join('test_load_mmap.npz'))
+        spam = np.asfortranarray(np.arange(12.).reshape(3, 4))
+        test_data = {'spam': spam, 'eggs': np.array([], dtype='int32'),
+                     'ham': 'spam', '_schema': schema_data}
+        np.savez(storage_path, **test_data)
+
+        npz_file = npz.Storage(storage_path=storage_path, mmap_mode=mmap_mode)
+        assert isinstance(npz_file.data.spam.value, np.memmap)
+        assert np.array_equal(npz_file.data.spam.value, spam)
+        assert npz_file.data.spam.value.flags.f_contiguous
+        assert npz_file.data.eggs.value.size == 0
+        assert npz_file.data.ham.value == 'spam'
+
+        npz_file.data.eggs.value = np.array([23, 42], dtype='int32')
+        npz_file.save()
+        assert np.array_equal(npz_file.data.spam.value, spam)
+
+        npz_file = npz.Storage(storage_path=storage_path)
+        assert np.array_equal(npz_file.data.spam.value, spam)
+        assert np.array_equal(npz_file.data.eggs.value, [23, 42])
+
+    def test_load_mmap_write(self, tmpdir):
+        schema_node = schema.Array(dtype='int32')
+        schema_data = json.dumps(schema_node.to_dict(), sort_keys=True)
+        storage_path = str(tmpdir.join('test_load_mmap_write.npz'))
+        np.savez(storage_path, data=np.array([23, 42], dtype='int32'),
+                 _schema=schema_data)
+
+        npz_file = npz.Storage(storage_path=storage_path, mmap_mode='c')
+        npz_file.data.value[0] = 1
+        del npz_file
+
+        # Without saving, the file must be unchanged and still valid.
+        npz_file = npz.Storage(storage_path=storage_path)
+        assert np.array_equal(npz_file.data.value, [23, 42])
+
     def test_load_item(self, tmpdir):
         schema_node = schema.Bool()
         schema_data = json.dumps(schema_node.to_dict(), sort_keys=True)
@@ -170,6 +313,100 @@ class TestStorage:
             assert file_['data.item_1'].dtype == 'bool'
             assert not file_['data.item_1'][0]
 
+    @pytest.mark.parametrize('compression', ('blosc-lz4', 'zstd'))
+    def test_save_compressed(self, tmpdir, compression):
+        pytest.importorskip('blosc2')
+        schema_node = schema.Compilation({
+            'spam': schema.Array(dtype='float64'),
+            'eggs': schema.Array(dtype='int32', max_shape=(None, None)),
+            'ham': schema.String(),
+        })
+        storage_path = str(tmpdir.join('test_save_compressed.npz'))
+        npz_file = npz.Storage(storage_path=storage_path,
+                               schema_node=schema_node,
+                               compression=compression)
+        npz_file.data.spam.value = np.linspace(0, 1, 1000)
+        npz_file.data.eggs.value = np.asfortranarray(
+            np.arange(12, dtype='int32').reshape(3, 4))
+        npz_file.data.ham.value = 'spam'
+        npz_file.save()
+
+        with zipfile.ZipFile(storage_path) as file_:
+            names = file_.namelist()
+            assert all(info.compress_type == zipfile.ZIP_STORED
+                       for info in file_.infolist())
+        assert '_schema.blp' in names
+        assert 'spam.blp' in names
+
+        npz_file = npz.Storage(storage_path=storage_path)
+        assert np.array_equal(npz_file.data.spam.value,
+                              np.linspace(0, 1, 1000))
+        assert np.array_equal(npz_file.data.eggs.value,
+                              np.arange(12).reshape(3, 4))
+        assert npz_file.data.ham.value == 'spam'
+
+    def test_save_compressed_list(self, tmpdir):
+        pytest.importorskip('blosc2')
+        schema_node = schema.List(schema.Array(dtype='int32'))
+        storage_path = str(tmpdir.join('test_save_compressed_list.npz'))
+        npz_file = npz.Storage(storage_path=storage_path,
+                               schema_node=schema_node, compression='zstd')
+        npz_file.data.replace([np.arange(idx, dtype='int32')
+                               for idx in range(20)])
+        npz_file.save()
+
+        npz_file = npz.Storage(storage_path=storage_path)
+        assert len(npz_file.data) == 20
+        for idx in range(20):
+            assert np.array_equal(npz_file.data[idx].value, np.arange(idx))
+
+    def test_save_compressed_chunks(self, tmpdir, monkeypatch):
+        pytest.importorskip('blosc2')
+        monkeypatch.setattr(npz, '_CHUNK_SIZE', 1000)
+        schema_node = schema.Compilation({
+            'spam': schema.Array(dtype='float64', max_shape=(None, None)),
+            'eggs': schema.Array(dtype='int32'),
+            'ham': schema.Array(dtype='int32'),
+        })
+        storage_path = str(tmpdir.join('test_save_compressed_chunks.npz'))
+        npz_file = npz.Storage(storage_path=storage_path,
+                               schema_node=schema_node, compression='zstd')
+        spam = np.asfortranarray(np.linspace(0, 1, 3000).reshape(100, 30))
+        npz_file.data.spam.value = spam
+        npz_file.data.eggs.value = np.arange(10, dtype='int32')
+        npz_file.data.ham.value = np.arange(1001, dtype='int32')
+        npz_file.save()
+
+        npz_file = npz.Storage(storage_path=storage_path)
+        assert np.array_equal(npz_file.data.spam.value, spam)
+        assert np.array_equal(npz_file.data.eggs.value, np.arange(10))
+        assert np.array_equal(npz_file.data.ham.value, np.arange(1001))
+
+    def test_save_compressed_empty(self, tmpdir):
+        pytest.importorskip('blosc2')
+        schema_node = schema.Array(dtype='int32')
+        storage_path = str(tmpdir.join('test_save_compressed_empty.npz'))
+        npz_file = npz.Storage(storage_path=storage_path,
+                               schema_node=schema_node, compression='zstd')
+        npz_file.data.value = np.array([], dtype='int32')
+        npz_file.save()
+
+        with np.load(storage_path) as file_:
+            assert file_['data'].size == 0
+
+    @pytest.mark.parametrize('mmap_mode', ('r+', 'w+'))
+    def test_unsupported_mmap_mode(self, tmpdir, mmap_mode):
+        storage_path = str(tmpdir.join('test_unsupported_mmap_mode.npz'))
+        with pytest.raises(ValueError):
+            npz.Storage(storage_path=storage_path, schema_node=schema.Bool(),
+                        mmap_mode=mmap_mode)
+
+    def test_unsupported_compression(self, tmpdir):
+        storage_path = str(tmpdir.join('test_unsupported_compression.npz'))
+        with pytest.raises(ValueError):
+            npz.Storage(storage_path=storage_path, schema_node=schema.Bool(),
+                        compression='spam')
+
 
 def test_inflate_dotted():
     input = {
@@ -197,3 +434,5 @@ def test_flatten_dotted():
         'foo.bar.baz': 1337,
         'baz.bar.foo': 9000
     }
+    assert list(output) == ['foo.foo.foo', 'foo.bar.foo', 'foo.bar.baz',
+                            'baz.bar.foo']
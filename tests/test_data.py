@@ -136,6 +136,9 @@ class ItemNodeTestBase:
         data_node.value = self.valid_data
         assert compare_values(data_node.value, self.valid_data)
 
+    def test_slots(self, data_node):
+        assert not hasattr(data_node, '__dict__')
+
     def test_validate(self, data_node):
         data_node.value = self.valid_data
         data_node.validate()
@@ -155,6 +158,30 @@ class TestArray(ItemNodeTestBase):
     schema_node = schema.Array(dtype='int32')
     valid_data = np.array([23, 42], dtype='int32')
 
+    def test_array(self, data_node):
+        data_node.value = self.valid_data
+        assert np.array_equal(np.asarray(data_node), self.valid_data)
+        assert np.asarray(data_node, dtype='float64').dtype == 'float64'
+        assert np.sum(data_node) == 65
+
+    def test_array_no_copy(self, data_node):
+        data_node.value = self.valid_data
+        array = data_node.__array__(copy=False)
+        assert np.array_equal(array, self.valid_data)
+        assert data_node.__array__(dtype='int32', copy=False).dtype == 'int32'
+        with pytest.raises(ValueError):
+            data_node.__array__(dtype='float64', copy=False)
+
+    def test_array_properties(self, data_node):
+        data_node.value = np.zeros(3, dtype='int32')
+        assert data_node.shape == (3,)
+        assert data_node.ndim == 1
+        assert data_node.dtype == 'int32'
+
+    def test_array_properties_empty(self, data_node):
+        with pytest.raises(exceptions.NodeEmptyError):
+            data_node.shape
+
     def test_getitem(self, data_node):
         data_node.value = self.valid_data
         for idx, item in enumerate(self.valid_data):
@@ -168,6 +195,16 @@ class TestArray(ItemNodeTestBase):
         assert data_node.value.ndim == 1
         assert data_node.value.shape == (5,)
 
+    def test_resize_per_dimension(self, backend):
+        data_node = backend.module.Array(
+            schema.Array(dtype='int32', max_shape=(None, None)), parent=None,
+            new_params=backend.new_params)
+        data_node.value = np.arange(6, dtype='int32').reshape(2, 3)
+        data_node.resize((3, 2))
+        assert np.array_equal(data_node.value, [[0, 1], [3, 4], [0, 0]])
+        data_node.resize((2, 1))
+        assert np.array_equal(data_node.value, [[0], [3]])
+
     def test_setitem(self, data_node):
         data_node.value = np.array([5, 23, 42])
         data_node[0] = 1
@@ -277,12 +314,28 @@ class TestCompilation:
         assert data_node.spam == data_node._subnodes['spam']
         assert data_node.eggs == data_node._subnodes['eggs']
 
+    def test_getattr_missing(self, data_node, valid_subnode_data):
+        assert not hasattr(data_node, 'ham')
+
+    def test_getattr_reserved(self, backend, schema_subnode,
+                              valid_subnode_data):
+        schema_node = schema.Compilation({'clear': schema_subnode,
+                                          'parent': schema_subnode})
+        data_node = backend.module.Compilation(schema_node, parent=None,
+                                               new_params=backend.new_params)
+        assert callable(data_node.clear)
+        assert data_node.parent is None
+        assert 'clear' in data_node._subnodes
+
     def test_init(self, data_node, valid_subnode_data):
         assert hasattr(data_node, 'spam')
         assert hasattr(data_node, 'eggs')
         assert 'spam' in data_node._subnodes
         assert 'eggs' in data_node._subnodes
 
+    def test_iter(self, data_node, valid_subnode_data):
+        assert list(data_node) == [data_node.spam, data_node.eggs]
+
     def test_load_from(self, data_node, foreign_backend, schema_subnode,
                        valid_subnode_data):
         schema_node = schema.Compilation({'spam': schema_subnode,
@@ -452,6 +505,13 @@ class TestList:
         # Still empty, because the sub-nodes are empty
         assert data_node.empty
 
+    def test_extend(self, data_node, valid_subnode_data):
+        data_node.append(valid_subnode_data)
+        data_node.extend([valid_subnode_data, None])
+        assert len(data_node) == 3
+        assert compare_values(data_node[1].value, valid_subnode_data)
+        assert data_node[2].empty
+
     def test_getitem(self, data_node, valid_subnode_data, backend,
                      schema_subnode):
         data_node.append(valid_subnode_data)
@@ -463,6 +523,12 @@ class TestList:
         assert data_node.schema_node.subnode == schema_subnode
         assert data_node._subnodes == []
 
+    def test_iter(self, data_node, valid_subnode_data):
+        assert list(data_node) == []
+        data_node.append(valid_subnode_data)
+        data_node.append(valid_subnode_data)
+        assert list(data_node) == [data_node[0], data_node[1]]
+
     def test_len(self, data_node, valid_subnode_data):
         assert len(data_node) == 0
         data_node.append(valid_subnode_data)
@@ -480,6 +546,18 @@ class TestList:
         assert compare_values(data_node[0].value, valid_subnode_data)
         assert compare_values(data_node[1].value, valid_subnode_data)
 
+    def test_load_from_nonempty(self, data_node, foreign_backend,
+                                schema_subnode, valid_subnode_data):
+        data_node_foreign = foreign_backend.module.List(
+            schema.List(schema_subnode), parent=None,
+            new_params=foreign_backend.new_params)
+        data_node_foreign.append(valid_subnode_data)
+        data_node.append()
+        data_node.load_from(data_node_foreign)
+        assert len(data_node) == 2
+        assert data_node[0].empty
+        assert compare_values(data_node[1].value, valid_subnode_data)
+
     def test_load_from_incompatible(self, data_node, foreign_backend,
                                     schema_subnode, valid_subnode_data):
         data_node_foreign = foreign_backend.module.Compilation(
@@ -519,6 +597,9 @@ class TestList:
         with pytest.raises(exceptions.ResetSubnodeError):
             data_node[0] = valid_subnode_data
 
+    def test_slots(self, data_node, valid_subnode_data):
+        assert not hasattr(data_node, '__dict__')
+
     def test_validate(self, data_node, valid_subnode_data):
         data_node.append(valid_subnode_data)
         data_node.validate()
@@ -590,3 +671,68 @@ def test_validation_error_chain(backend):
     assert str(err.value).startswith(
         'Node "spam[1].eggs[2]" failed validation:')
     assert str(err.value).endswith(str(err.value.original_cause()))
+
+
+def test_validation_error_chain_deep():
+    original_cause = exceptions.ValidationError('Invalid type/value.', 'str')
+    error = original_cause
+    for idx in range(3000):
+        cause = error
+        error = exceptions.SubnodeValidationError(idx % 2 or 'spam')
+        error.__cause__ = cause
+    assert error.node_path() == '[1].spam' * 1500
+    assert error.node_path() is error.node_path()
+    assert error.original_cause() is original_cause
+
+
+def test_item_name():
+    assert data._item_name(0) == 'item_0'
+    assert data._item_name(42) == 'item_42'
+
+
+def test_node_class(backend):
+    node_class = data._node_class(backend.module.__name__, 'Compilation')
+    assert node_class is backend.module.Compilation
+
+
+def test_repr(backend):
+    schema_node = schema.Compilation({
+        'spam': schema.Bool(),
+        'eggs': schema.List(schema.Compilation({
+            'ham': schema.Scalar(dtype='int32', unit='V'),
+            'bacon': schema.Array(dtype='int32')})),
+    })
+    data_node = backend.module.Compilation(schema_node, parent=None,
+                                           new_params=backend.new_params)
+    data_node.spam.value = True
+    data_node.eggs.append({'ham': 23})
+    data_node.eggs.append({'bacon': np.array([1, 2, 3], dtype='int32')})
+    assert repr(data_node) == '\n'.join((
+        '(Compilation)',
+        ' ├─ spam (Bool): True',
+        ' └─ eggs (List)',
+        '    ├─ [0] (Compilation)',
+        '    │  ├─ ham (Scalar): 23 V',
+        '    │  └─ bacon (Array): <empty>',
+        '    └─ [1] (Compilation)',
+        '       ├─ ham (Scalar): <empty>',
+        '       └─ bacon (Array): 3 array',
+    ))
+    assert repr(data_node.spam) == '(Bool): True'
+
+
+def test_repr_max_depth(backend, monkeypatch):
+    schema_node = schema.Compilation({
+        'spam': schema.Bool(),
+        'eggs': schema.List(schema.Bool()),
+    })
+    data_node = backend.module.Compilation(schema_node, parent=None,
+                                           new_params=backend.new_params)
+    data_node.eggs.append(True)
+    monkeypatch.setattr(data, 'MAX_REPR_DEPTH', 1)
+    assert repr(data_node) == '\n'.join((
+        '(Compilation)',
+        ' ├─ spam (Bool): <empty>',
+        ' └─ eggs (List)',
+        '    └─ ...',
+    ))
@@ -2,6 +2,7 @@ import importlib
 import itertools
 from collections import namedtuple
 
+import numpy as np
 import pytest
 
 from dsch import exceptions, frontend, schema
@@ -33,6 +34,25 @@ def foreign_backend(request, tmpdir):
     return backend
 
 
+@pytest.mark.parametrize('storage_path, backend_name', (
+    ('::inmem::', 'inmem'),
+    ('test.h5', 'hdf5'),
+    ('test.hdf5', 'hdf5'),
+    ('test.mat', 'mat'),
+    ('test.npz', 'npz'),
+    ('dir.mat/test.npz', 'npz'),
+))
+def test_autodetect_backend(storage_path, backend_name):
+    assert frontend._autodetect_backend(storage_path) == backend_name
+
+
+@pytest.mark.parametrize('storage_path', ('test', 'test.txt', 'npz',
+                                          'test.npz/file'))
+def test_autodetect_backend_fail(storage_path):
+    with pytest.raises(exceptions.AutodetectBackendError):
+        frontend._autodetect_backend(storage_path)
+
+
 def test_create(backend):
     schema_node = schema.Bool()
     storage = frontend.create(backend.storage_path, schema_node)
@@ -68,6 +88,21 @@ def test_load(backend):
     assert new_storage.data.value is True
 
 
+def test_load_mmap(backend):
+    schema_node = schema.Array(dtype='int32')
+    storage = frontend.create(backend.storage_path, schema_node)
+    storage.data.value = np.array([23, 42], dtype='int32')
+    storage.save()
+
+    if backend.module.__name__ != 'dsch.backends.npz':
+        with pytest.raises(ValueError):
+            frontend.load(backend.storage_path, mmap_mode='r')
+        return
+    new_storage = frontend.load(backend.storage_path, mmap_mode='r')
+    assert isinstance(new_storage.data.value, np.memmap)
+    assert np.array_equal(new_storage.data.value, [23, 42])
+
+
 def test_load_require_schema(backend):
     schema_node = schema.Bool()
     storage = frontend.create(backend.storage_path, schema_node)
@@ -99,6 +134,37 @@ def test_load_validation_fail(backend):
     frontend.load(backend.storage_path, force=True)
 
 
+def test_load_validation_trust_hash(backend):
+    schema_node = schema.String(max_length=3)
+    storage = frontend.create(backend.storage_path, schema_node)
+    storage.data.value = 'spam'
+    storage.save(force=True)
+
+    # Without a required schema, there is nothing to trust.
+    with pytest.raises(exceptions.ValidationError):
+        frontend.load(backend.storage_path, trust_hash=True)
+    frontend.load(backend.storage_path, required_schema=schema_node,
+                  trust_hash=True)
+    frontend.load(backend.storage_path,
+                  required_schema_hash=schema_node.hash(), trust_hash=True)
+
+
+def test_load_verify_checksums(backend):
+    schema_node = schema.Array(dtype='int32')
+    storage = frontend.create(backend.storage_path, schema_node)
+    storage.data.value = np.array([23, 42], dtype='int32')
+    storage.save()
+
+    if backend.module.__name__ != 'dsch.backends.npz':
+        with pytest.raises(ValueError):
+            frontend.load(backend.storage_path, verify_checksums=False)
+        return
+    assert frontend.load(backend.storage_path).verify_checksums
+    new_storage = frontend.load(backend.storage_path, verify_checksums=False)
+    assert not new_storage.verify_checksums
+    assert np.array_equal(new_storage.data.value, [23, 42])
+
+
 class TestPseudoStorageNode:
     """Tests for the PseudoStorage class when given a data node."""
 
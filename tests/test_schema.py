@@ -217,6 +217,13 @@ class TestArray:
         assert err.value.expected == 42
         assert err.value.got == np.array([43])
 
+    def test_validate_fail_max_value_nan(self):
+        node = schema.Array(dtype='float64', max_value=42)
+        with pytest.raises(ValidationError) as err:
+            node.validate(np.array([np.nan, 43, 23]), None)
+        assert err.value.message == 'Maximum array element value exceeded.'
+        assert err.value.got == np.array([43])
+
     def test_validate_fail_min_value(self):
         node = schema.Array(dtype='int32', min_value=23)
         with pytest.raises(ValidationError) as err:
@@ -225,6 +232,13 @@ class TestArray:
         assert err.value.expected == 23
         assert err.value.got == np.array([22])
 
+    def test_validate_fail_min_value_nan(self):
+        node = schema.Array(dtype='float64', min_value=23)
+        with pytest.raises(ValidationError) as err:
+            node.validate(np.array([np.nan, 22, 42]), None)
+        assert err.value.message == 'Minimum array element value undercut.'
+        assert err.value.got == np.array([22])
+
     @pytest.mark.parametrize('test_data', (0, 1, [23, 42], 'spam'))
     def test_validate_fail_type(self, test_data):
         node = schema.Array(dtype='int32')